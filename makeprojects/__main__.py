@@ -25,11 +25,47 @@ from funcsigs import signature
 import burger
 
 from .core import Solution, Project, Configuration
+from .enums import IDETypes, PlatformTypes
 from .config import BUILD_RULES_PY, DEFAULT_BUILD_RULES
 from .__pkginfo__ import VERSION
 from .defaults import get_project_name, get_ide_list, get_platform_list, \
     fixup_ide_platform, get_project_type, get_configuration_list
 
+## Switches that select an IDE, with the name passed to IDETypes.lookup()
+_IDE_SWITCHES = (
+    ('-xcode3', 'xcode3', 'Build for Xcode 3.'),
+    ('-xcode4', 'xcode4', 'Build for Xcode 4.'),
+    ('-xcode5', 'xcode5', 'Build for Xcode 5.'),
+    ('-xcode6', 'xcode6', 'Build for Xcode 6.'),
+    ('-xcode7', 'xcode7', 'Build for Xcode 7.'),
+    ('-xcode8', 'xcode8', 'Build for Xcode 8.'),
+    ('-xcode9', 'xcode9', 'Build for Xcode 9.'),
+    ('-xcode10', 'xcode10', 'Build for Xcode 10.'),
+    ('-vs2005', 'vs2005', 'Build for Visual Studio 2005.'),
+    ('-vs2008', 'vs2008', 'Build for Visual Studio 2008.'),
+    ('-vs2010', 'vs2010', 'Build for Visual Studio 2010.'),
+    ('-vs2012', 'vs2012', 'Build for Visual Studio 2012.'),
+    ('-vs2013', 'vs2013', 'Build for Visual Studio 2013.'),
+    ('-vs2015', 'vs2015', 'Build for Visual Studio 2015.'),
+    ('-vs2017', 'vs2017', 'Build for Visual Studio 2017.'),
+    ('-vs2019', 'vs2019', 'Build for Visual Studio 2019.'),
+    ('-codeblocks', 'codeblocks', 'Build for CodeBlocks 16.01'),
+    ('-codewarrior', 'codewarrior',
+     'Build for Metrowerks / Freescale CodeWarrior'),
+    ('-watcom', 'watcom', 'Build for Watcom WMAKE'),
+    ('-linux', 'make', 'Build for Linux make')
+)
+
+## Switches that select a platform, with the name passed to
+# PlatformTypes.lookup()
+_PLATFORM_SWITCHES = (
+    ('-ios', 'ios', 'Build for iOS with XCode 5 or higher.'),
+    ('-vita', 'vita', 'Build for PS Vita with Visual Studio 2010.'),
+    ('-360', 'xbox360', 'Build for XBox 360 with Visual Studio 2010.'),
+    ('-wiiu', 'wiiu', 'Build for WiiU with Visual Studio 2013.'),
+    ('-dsi', 'dsi', 'Build for Nintendo DSI with Visual Studio 2015.')
+)
+
 ########################################
 
 
@@ -210,6 +246,29 @@ def process(working_directory, args):
 ########################################
 
 
+def _resolve_names(enum_type, names):
+    """
+    Convert names from the command line into enumerations.
+
+    Names that can't be found are left as is, so they are reported as
+    unsupported when each directory is processed.
+
+    Args:
+        enum_type: IDETypes or PlatformTypes.
+        names: List of names from the command line.
+    Returns:
+        List of enumerations or unknown names.
+    """
+
+    result = []
+    for item in names:
+        resolved = enum_type.lookup(item)
+        result.append(item if resolved is None else resolved)
+    return result
+
+########################################
+
+
 def main(working_directory=None, args=None):
     """
     Main entry point when invoked as a tool.
@@ -272,82 +331,13 @@ def main(working_directory=None, args=None):
                         metavar='<project type>', default=[],
                         help='Type of project to create.')
 
-    parser.add_argument('-xcode3', dest='xcode3', action='store_true',
-                        default=False, help='Build for Xcode 3.')
-    parser.add_argument('-xcode4', dest='xcode4', action='store_true',
-                        default=False, help='Build for Xcode 4.')
-    parser.add_argument('-xcode5', dest='xcode5', action='store_true',
-                        default=False, help='Build for Xcode 5.')
-    parser.add_argument('-xcode6', dest='xcode6', action='store_true',
-                        default=False, help='Build for Xcode 6.')
-    parser.add_argument('-xcode7', dest='xcode7', action='store_true',
-                        default=False, help='Build for Xcode 7.')
-    parser.add_argument('-xcode8', dest='xcode8', action='store_true',
-                        default=False, help='Build for Xcode 8.')
-    parser.add_argument('-xcode9', dest='xcode9', action='store_true',
-                        default=False, help='Build for Xcode 9.')
-    parser.add_argument('-xcode10', dest='xcode10', action='store_true',
-                        default=False, help='Build for Xcode 10.')
-
-    parser.add_argument('-vs2005', dest='vs2005', action='store_true',
-                        default=False, help='Build for Visual Studio 2005.')
-    parser.add_argument('-vs2008', dest='vs2008', action='store_true',
-                        default=False, help='Build for Visual Studio 2008.')
-    parser.add_argument('-vs2010', dest='vs2010', action='store_true',
-                        default=False, help='Build for Visual Studio 2010.')
-    parser.add_argument('-vs2012', dest='vs2012', action='store_true',
-                        default=False, help='Build for Visual Studio 2012.')
-    parser.add_argument('-vs2013', dest='vs2013', action='store_true',
-                        default=False, help='Build for Visual Studio 2013.')
-    parser.add_argument('-vs2015', dest='vs2015', action='store_true',
-                        default=False, help='Build for Visual Studio 2015.')
-    parser.add_argument('-vs2017', dest='vs2017', action='store_true',
-                        default=False, help='Build for Visual Studio 2017.')
-    parser.add_argument('-vs2019', dest='vs2019', action='store_true',
-                        default=False, help='Build for Visual Studio 2019.')
-
-    parser.add_argument('-codeblocks', dest='codeblocks', action='store_true',
-                        default=False, help='Build for CodeBlocks 16.01')
-    parser.add_argument(
-        '-codewarrior',
-        dest='codewarrior',
-        action='store_true',
-        default=False,
-        help='Build for Metrowerks / Freescale CodeWarrior')
-    parser.add_argument('-watcom', dest='watcom', action='store_true',
-                        default=False, help='Build for Watcom WMAKE')
-    parser.add_argument('-linux', dest='linux', action='store_true',
-                        default=False, help='Build for Linux make')
-    parser.add_argument(
-        '-ios',
-        dest='ios',
-        action='store_true',
-        default=False,
-        help='Build for iOS with XCode 5 or higher.')
-    parser.add_argument(
-        '-vita',
-        dest='vita',
-        action='store_true',
-        default=False,
-        help='Build for PS Vita with Visual Studio 2010.')
-    parser.add_argument(
-        '-360',
-        dest='xbox360',
-        action='store_true',
-        default=False,
-        help='Build for XBox 360 with Visual Studio 2010.')
-    parser.add_argument(
-        '-wiiu',
-        dest='wiiu',
-        action='store_true',
-        default=False,
-        help='Build for WiiU with Visual Studio 2013.')
-    parser.add_argument(
-        '-dsi',
-        dest='dsi',
-        action='store_true',
-        default=False,
-        help='Build for Nintendo DSI with Visual Studio 2015.')
+    # Shortcut switches, each one adds an entry to the -g or -p list
+    for switch, name, help_text in _IDE_SWITCHES:
+        parser.add_argument(switch, dest='ides', action='append_const',
+                            const=name, help=help_text)
+    for switch, name, help_text in _PLATFORM_SWITCHES:
+        parser.add_argument(switch, dest='platforms', action='append_const',
+                            const=name, help=help_text)
 
     parser.add_argument(
         '-finalfolder',
@@ -384,6 +374,10 @@ def main(working_directory=None, args=None):
         save_default(working_directory)
         return 0
 
+    # Look up the IDEs and platforms once instead of for every directory
+    args.ides = _resolve_names(IDETypes, args.ides)
+    args.platforms = _resolve_names(PlatformTypes, args.platforms)
+
     # Make a list of directories to process
     if not args.directories:
         args.directories = (working_directory,)
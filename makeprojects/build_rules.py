@@ -17,6 +17,36 @@ import os
 
 from makeprojects.enums import PlatformTypes, ProjectTypes, IDETypes
 
+## Configurations every platform supports
+_DEFAULT_CONFIGURATIONS = (
+    {'name': 'Debug', 'short_code': 'dbg', 'debug': True},
+    {'name': 'Internal', 'short_code': 'int', 'optimization': 4,
+     'debug': True},
+    {'name': 'Release', 'short_code': 'rel', 'optimization': 4})
+
+## Link time code generation configuration
+_LTCG_CONFIGURATION = {
+    'name': 'Release_LTCG',
+    'short_code': 'ltc',
+    'optimization': 4,
+    'link_time_code_generation': True}
+
+## Platforms that support link time code generation in Visual Studio
+_LTCG_PLATFORMS = (
+    PlatformTypes.win32,
+    PlatformTypes.win64,
+    PlatformTypes.winarm32,
+    PlatformTypes.winarm64,
+    PlatformTypes.winitanium,
+    PlatformTypes.xbox360)
+
+## Configurations specific to the Xbox 360
+_XBOX360_CONFIGURATIONS = (
+    {'name': 'Profile', 'short_code': 'pro',
+     'optimization': 4, 'profile': True},
+    {'name': 'Profile_FastCap', 'short_code': 'fas',
+     'optimization': 4, 'profile': 'fast'},
+    {'name': 'CodeAnalysis', 'short_code': 'cod', 'analyze': True})
 
 ########################################
 
@@ -241,33 +271,17 @@ def do_configuration_list(platform, ide):
     """
 
     # All platforms support this format.
-    results = [
-        {'name': 'Debug', 'short_code': 'dbg', 'debug': True},
-        {'name': 'Internal', 'short_code': 'int', 'optimization': 4,
-         'debug': True},
-        {'name': 'Release', 'short_code': 'rel', 'optimization': 4}]
+    # The caller updates the dicts, so always return copies
+    results = [dict(item) for item in _DEFAULT_CONFIGURATIONS]
 
     # Xbox and Windows support link time code generation
     # as a platform
-    if ide.is_visual_studio() and platform in (PlatformTypes.win32,
-                                               PlatformTypes.win64,
-                                               PlatformTypes.winarm32,
-                                               PlatformTypes.winarm64,
-                                               PlatformTypes.winitanium,
-                                               PlatformTypes.xbox360):
-        results.append({'name': 'Release_LTCG',
-                        'short_code': 'ltc',
-                        'optimization': 4,
-                        'link_time_code_generation': True})
+    if ide.is_visual_studio() and platform in _LTCG_PLATFORMS:
+        results.append(dict(_LTCG_CONFIGURATION))
 
     # Configurations specific to the Xbox 360
     if platform is PlatformTypes.xbox360:
-        results.extend(
-            [{'name': 'Profile', 'short_code': 'pro',
-              'optimization': 4, 'profile': True},
-             {'name': 'Profile_FastCap', 'short_code': 'fas',
-              'optimization': 4, 'profile': 'fast'},
-             {'name': 'CodeAnalysis', 'short_code': 'cod', 'analyze': True}])
+        results.extend(dict(item) for item in _XBOX360_CONFIGURATIONS)
 
     return results
 
@@ -27,6 +27,66 @@ from .enums import FileTypes, ProjectTypes, PlatformTypes, IDETypes
 
 SUPPORTED_IDES = (IDETypes.codeblocks,)
 
+## XML header and start of every project file
+_CBP_HEADER = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes" ?>',
+    '<CodeBlocks_project_file>',
+    '\t<FileVersion major="1" minor="6" />',
+    '\t<Project>'
+)
+
+## Project options that follow the title
+_CBP_PROJECT_OPTIONS = (
+    '\t\t<Option makefile="makefile" />',
+    '\t\t<Option pch_mode="2" />',
+    '\t\t<Option compiler="ow" />'
+)
+
+## Build environment and the end of the Build record
+_CBP_ENVIRONMENT = (
+    '\t\t\t<Environment>',
+    '\t\t\t\t<Variable name="ERROR_FILE" '
+    'value="$(TARGET_OBJECT_DIR)foo.err" />',
+    '\t\t\t</Environment>',
+    '\t\t</Build>'
+)
+
+## Start of each Target record, filled in with str.format()
+_CBP_TARGET_TEMPLATE = (
+    '\t\t\t<Target title="{title}">',
+    '\t\t\t\t<Option output="{output}" prefix_auto="0" extension_auto="0" />',
+    '\t\t\t\t<Option working_dir="" />',
+    '\t\t\t\t<Option object_output="{object_output}" />',
+    '\t\t\t\t<Option type="{type}" />',
+    '\t\t\t\t<Option compiler="ow" />',
+    '\t\t\t\t<Option createDefFile="1" />',
+    '\t\t\t\t<Compiler>',
+    '\t\t\t\t\t<Add option="-bt={system}" />'
+)
+
+## Compiler options shared by every target
+_CBP_COMMON_OPTIONS = (
+    # Maximum warnings
+    '\t\t\t\t\t<Add option="-wx" />',
+    # Pentium Pro floating point
+    '\t\t\t\t\t<Add option="-fp6" />',
+    # Pentium Pro optimizations
+    '\t\t\t\t\t<Add option="-6r" />',
+    # Error file name
+    '\t\t\t\t\t<Add option="-fr=$(ERROR_FILE)" />'
+)
+
+## Extensions and closing tags at the end of every project file
+_CBP_EXTENSIONS = (
+    '\t\t<Extensions>',
+    '\t\t\t<code_completion />',
+    '\t\t\t<envvars />',
+    '\t\t\t<debugger />',
+    '\t\t</Extensions>',
+    '\t</Project>',
+    '</CodeBlocks_project_file>'
+)
+
 ########################################
 
 
@@ -113,57 +173,47 @@ class Project(object):
             line_list = []
 
         # Save the standard XML header for CodeBlocks
-        line_list.append(
-            '<?xml version="1.0" encoding="UTF-8" standalone="yes" ?>')
-        line_list.append('<CodeBlocks_project_file>')
-        line_list.append('\t<FileVersion major="1" minor="6" />')
-        line_list.append('\t<Project>')
+        line_list.extend(_CBP_HEADER)
 
         # Output the project settings
 
         line_list.append('\t\t<Option title="' + self.solution.name + '" />')
-        line_list.append('\t\t<Option makefile="makefile" />')
-        line_list.append('\t\t<Option pch_mode="2" />')
-        line_list.append('\t\t<Option compiler="ow" />')
+        line_list.extend(_CBP_PROJECT_OPTIONS)
 
         # Output the per target build settings
         line_list.append('\t\t<Build>')
+        target_list = []
         for configuration in self.configuration_list:
-            target_name = configuration.name + '_' + configuration.platform.get_short_code()
-
-            line_list.append('\t\t\t<Target title="' + target_name + '">')
+            target_name = configuration.name + '_' + \
+                configuration.platform.get_short_code()
+            target_list.append(target_name)
 
-            binary_name = 'bin/{}{}'.format(
-                configuration.project.name,
-                configuration.get_suffix())
+            base_name = configuration.project.name + \
+                configuration.get_suffix()
             if configuration.project_type.is_library():
-                binary_name = binary_name + '.lib'
+                binary_name = 'bin/{}.lib'.format(base_name)
             else:
-                binary_name = binary_name + '.exe'
-
-            line_list.append(
-                '\t\t\t\t<Option output="' + binary_name + '" prefix_auto="0" extension_auto="0" />')
-            line_list.append('\t\t\t\t<Option working_dir="" />')
-
-            intdirectory = 'temp/{}{}/'.format(
-                configuration.project.name,
-                configuration.get_suffix())
-            line_list.append(
-                '\t\t\t\t<Option object_output="' + intdirectory + '" />')
+                binary_name = 'bin/{}.exe'.format(base_name)
 
             if configuration.project_type is ProjectTypes.tool:
-                line_list.append('\t\t\t\t<Option type="1" />')
+                target_type = '1'
             else:
-                line_list.append('\t\t\t\t<Option type="2" />')
-
-            line_list.append('\t\t\t\t<Option compiler="ow" />')
-            line_list.append('\t\t\t\t<Option createDefFile="1" />')
-            line_list.append('\t\t\t\t<Compiler>')
+                target_type = '2'
 
             if configuration.platform.is_msdos():
-                line_list.append('\t\t\t\t\t<Add option="-bt=dos" />')
+                system = 'dos'
             else:
-                line_list.append('\t\t\t\t\t<Add option="-bt=nt" />')
+                system = 'nt'
+
+            # Fill in the start of the target record
+            values = {
+                'title': target_name,
+                'output': binary_name,
+                'object_output': 'temp/{}/'.format(base_name),
+                'type': target_type,
+                'system': system}
+            line_list.extend(
+                [item.format(**values) for item in _CBP_TARGET_TEMPLATE])
 
             # Include symbols
             if configuration.debug:
@@ -174,36 +224,20 @@ class Project(object):
                 line_list.append('\t\t\t\t\t<Add option="-ox" />')
                 line_list.append('\t\t\t\t\t<Add option="-ot" />')
 
-            # Maximum warnings
-            line_list.append('\t\t\t\t\t<Add option="-wx" />')
-
-            # Pentium Pro floating point
-            line_list.append('\t\t\t\t\t<Add option="-fp6" />')
-
-            # Pentium Pro optimizations
-            line_list.append('\t\t\t\t\t<Add option="-6r" />')
-
-            # Error file name
-            line_list.append('\t\t\t\t\t<Add option="-fr=$(ERROR_FILE)" />')
+            # Warnings, CPU and error file settings
+            line_list.extend(_CBP_COMMON_OPTIONS)
 
             # Defines
-            for item in configuration.get_chained_list('define_list'):
-                line_list.append('\t\t\t\t\t<Add option="-d' + item + '" />')
+            line_list.extend(
+                '\t\t\t\t\t<Add option="-d{}" />'.format(item)
+                for item in configuration.get_chained_list('define_list'))
             line_list.append('\t\t\t\t</Compiler>')
             line_list.append('\t\t\t</Target>')
 
-        line_list.append('\t\t\t<Environment>')
-        line_list.append(
-            '\t\t\t\t<Variable name="ERROR_FILE" value="$(TARGET_OBJECT_DIR)foo.err" />')
-        line_list.append('\t\t\t</Environment>')
-        line_list.append('\t\t</Build>')
+        line_list.extend(_CBP_ENVIRONMENT)
 
         # Output the virtual target
         line_list.append('\t\t<VirtualTargets>')
-        target_list = []
-        for configuration in self.configuration_list:
-            target_name = configuration.name + '_' + configuration.platform.get_short_code()
-            target_list.append(target_name)
         line_list.append(
             '\t\t\t<Add alias="Everything" targets="' +
             ';'.join(target_list) +
@@ -215,22 +249,19 @@ class Project(object):
 
         # Extract the directories from the files
         # Sort them for consistent diffs for source control
-        include_folders = []
+        # Use a set, since most configurations share the same folders
+        include_folders = set()
         for configuration in self.configuration_list:
-            for item in configuration.get_unique_chained_list(
-                    '_source_include_list'):
-                if item not in include_folders:
-                    include_folders.append(item)
-
-            for item in configuration.get_unique_chained_list(
-                    'include_folders_list'):
-                if item not in include_folders:
-                    include_folders.append(item)
+            include_folders.update(configuration.get_unique_chained_list(
+                '_source_include_list'))
+            include_folders.update(configuration.get_unique_chained_list(
+                'include_folders_list'))
 
-        for item in sorted(include_folders):
-            line_list.append('\t\t\t<Add directory=\'&quot;' +
-                             convert_to_linux_slashes(item) +
-                             '&quot;\' />')
+        # Convert the slashes once for each unique folder
+        line_list.extend(
+            '\t\t\t<Add directory=\'&quot;{}&quot;\' />'.format(
+                convert_to_linux_slashes(item))
+            for item in sorted(include_folders))
 
         if not self.solution.project_list[0].project_type.is_library() or \
                 self.solution.name != 'burger':
@@ -244,24 +275,13 @@ class Project(object):
         else:
             codefiles = []
 
-        for item in codefiles:
-            line_list.append(
-                '\t\t<Unit filename="' +
-                convert_to_linux_slashes(
-                    item.relative_pathname) +
-                '" />')
-
-        # Add the extensions (If any)
-        line_list.append('\t\t<Extensions>')
-        line_list.append('\t\t\t<code_completion />')
-        line_list.append('\t\t\t<envvars />')
-        line_list.append('\t\t\t<debugger />')
-        line_list.append('\t\t</Extensions>')
-
-        # Close the file
-
-        line_list.append('\t</Project>')
-        line_list.append('</CodeBlocks_project_file>')
+        line_list.extend(
+            '\t\t<Unit filename="{}" />'.format(
+                convert_to_linux_slashes(item.relative_pathname))
+            for item in codefiles)
+
+        # Add the extensions (If any) and close the file
+        line_list.extend(_CBP_EXTENSIONS)
         return 0
 
 ########################################
@@ -31,9 +31,10 @@ import os
 import operator
 import subprocess
 from burger import save_text_file_if_newer, perforce_edit, PY2, is_string, \
-    convert_to_linux_slashes, convert_to_windows_slashes, truefalse
+    convert_to_linux_slashes, convert_to_windows_slashes, truefalse, \
+    escape_xml_cdata, is_write_protected
 from .enums import FileTypes, ProjectTypes, IDETypes, PlatformTypes
-from .core import source_file_filter
+from .core import source_file_buckets
 
 if not PY2:
     unicode = str
@@ -95,16 +96,17 @@ class SETTING(object):
 
         # Write the name record if one exists
         if self.name is not None:
-            entry = entry + '<NAME>' + self.name + '</NAME>'
+            entry = entry + '<NAME>' + escape_xml_cdata(self.name) + '</NAME>'
 
         # Write the value record if one exists
         if self.value is not None:
             if is_string(self.value):
-                entry = entry + '<VALUE>' + self.value + '</VALUE>'
+                entry = entry + '<VALUE>' + \
+                    escape_xml_cdata(self.value) + '</VALUE>'
             else:
                 entry = entry + '<VALUE>'
                 for item in self.value:
-                    line_list.append(entry + item)
+                    line_list.append(entry + escape_xml_cdata(item))
                     entry = ''
                 entry = entry + '</VALUE>'
 
@@ -227,38 +229,75 @@ class MWProject_X86(object):
             item.generate(line_list, level)
 
 
+class StaticSettings(object):
+    """
+    List of SETTING records that are the same for every target.
+
+    The text lines are created once for each indentation level and
+    reused for every target that outputs them.
+    """
+
+    def __init__(self, settings):
+        """
+        Create the SETTING records.
+
+        Args:
+            settings: Iterable of (name, value) pairs
+        """
+
+        ## List of SETTING records
+        self.settings = [SETTING(name, value) for name, value in settings]
+
+        ## Text lines, keyed by indentation level
+        self.lines = {}
+
+    def generate(self, line_list, level=4):
+        """
+        Output the settings
+        """
+        lines = self.lines.get(level)
+        if lines is None:
+            lines = []
+            for item in self.settings:
+                item.generate(lines, level)
+            self.lines[level] = lines
+        line_list.extend(lines)
+
+
+## Settings for MWFrontEnd_C, they are the same for every target
+_MWFRONTEND_C_SETTINGS = StaticSettings((
+    ('MWFrontEnd_C_cplusplus', '1'),
+    ('MWFrontEnd_C_templateparser', '0'),
+    ('MWFrontEnd_C_instance_manager', '0'),
+    ('MWFrontEnd_C_enableexceptions', '0'),
+    ('MWFrontEnd_C_useRTTI', '0'),
+    ('MWFrontEnd_C_booltruefalse', '1'),
+    ('MWFrontEnd_C_wchar_type', '0'),
+    ('MWFrontEnd_C_ecplusplus', '0'),
+    ('MWFrontEnd_C_dontinline', '0'),
+    ('MWFrontEnd_C_inlinelevel', '0'),
+    ('MWFrontEnd_C_autoinline', '1'),
+    ('MWFrontEnd_C_defer_codegen', '0'),
+    ('MWFrontEnd_C_bottomupinline', '1'),
+    ('MWFrontEnd_C_ansistrict', '0'),
+    ('MWFrontEnd_C_onlystdkeywords', '0'),
+    ('MWFrontEnd_C_trigraphs', '0'),
+    ('MWFrontEnd_C_arm', '0'),
+    ('MWFrontEnd_C_checkprotos', '1'),
+    ('MWFrontEnd_C_c99', '1'),
+    ('MWFrontEnd_C_gcc_extensions', '1'),
+    ('MWFrontEnd_C_enumsalwaysint', '1'),
+    ('MWFrontEnd_C_unsignedchars', '0'),
+    ('MWFrontEnd_C_poolstrings', '1'),
+    ('MWFrontEnd_C_dontreusestrings', '0')))
+
+
 class MWFrontEnd_C(object):
     def __init__(self):
-        self.settings = [
-            SETTING('MWFrontEnd_C_cplusplus', '1'),
-            SETTING('MWFrontEnd_C_templateparser', '0'),
-            SETTING('MWFrontEnd_C_instance_manager', '0'),
-            SETTING('MWFrontEnd_C_enableexceptions', '0'),
-            SETTING('MWFrontEnd_C_useRTTI', '0'),
-            SETTING('MWFrontEnd_C_booltruefalse', '1'),
-            SETTING('MWFrontEnd_C_wchar_type', '0'),
-            SETTING('MWFrontEnd_C_ecplusplus', '0'),
-            SETTING('MWFrontEnd_C_dontinline', '0'),
-            SETTING('MWFrontEnd_C_inlinelevel', '0'),
-            SETTING('MWFrontEnd_C_autoinline', '1'),
-            SETTING('MWFrontEnd_C_defer_codegen', '0'),
-            SETTING('MWFrontEnd_C_bottomupinline', '1'),
-            SETTING('MWFrontEnd_C_ansistrict', '0'),
-            SETTING('MWFrontEnd_C_onlystdkeywords', '0'),
-            SETTING('MWFrontEnd_C_trigraphs', '0'),
-            SETTING('MWFrontEnd_C_arm', '0'),
-            SETTING('MWFrontEnd_C_checkprotos', '1'),
-            SETTING('MWFrontEnd_C_c99', '1'),
-            SETTING('MWFrontEnd_C_gcc_extensions', '1'),
-            SETTING('MWFrontEnd_C_enumsalwaysint', '1'),
-            SETTING('MWFrontEnd_C_unsignedchars', '0'),
-            SETTING('MWFrontEnd_C_poolstrings', '1'),
-            SETTING('MWFrontEnd_C_dontreusestrings', '0')
-        ]
+        self.settings = _MWFRONTEND_C_SETTINGS
 
     def generate(self, line_list, level=4):
-        for item in self.settings:
-            item.generate(line_list, level)
+        self.settings.generate(line_list, level)
 
 
 class C_CPP_Preprocessor(object):
@@ -284,38 +323,40 @@ class C_CPP_Preprocessor(object):
             item.generate(line_list, level)
 
 
+## Settings for MWWarning_C, they are the same for every target
+_MWWARNING_C_SETTINGS = StaticSettings((
+    ('MWWarning_C_warn_illpragma', '1'),
+    ('MWWarning_C_warn_possunwant', '1'),
+    ('MWWarning_C_pedantic', '1'),
+    ('MWWarning_C_warn_illtokenpasting', '0'),
+    ('MWWarning_C_warn_hidevirtual', '1'),
+    ('MWWarning_C_warn_implicitconv', '1'),
+    ('MWWarning_C_warn_impl_f2i_conv', '1'),
+    ('MWWarning_C_warn_impl_s2u_conv', '1'),
+    ('MWWarning_C_warn_impl_i2f_conv', '1'),
+    ('MWWarning_C_warn_ptrintconv', '1'),
+    ('MWWarning_C_warn_unusedvar', '1'),
+    ('MWWarning_C_warn_unusedarg', '1'),
+    ('MWWarning_C_warn_resultnotused', '0'),
+    ('MWWarning_C_warn_missingreturn', '1'),
+    ('MWWarning_C_warn_no_side_effect', '1'),
+    ('MWWarning_C_warn_extracomma', '1'),
+    ('MWWarning_C_warn_structclass', '1'),
+    ('MWWarning_C_warn_emptydecl', '1'),
+    ('MWWarning_C_warn_filenamecaps', '0'),
+    ('MWWarning_C_warn_filenamecapssystem', '0'),
+    ('MWWarning_C_warn_padding', '0'),
+    ('MWWarning_C_warn_undefmacro', '0'),
+    ('MWWarning_C_warn_notinlined', '0'),
+    ('MWWarning_C_warningerrors', '0')))
+
+
 class MWWarning_C(object):
     def __init__(self):
-        self.settings = [
-            SETTING('MWWarning_C_warn_illpragma', '1'),
-            SETTING('MWWarning_C_warn_possunwant', '1'),
-            SETTING('MWWarning_C_pedantic', '1'),
-            SETTING('MWWarning_C_warn_illtokenpasting', '0'),
-            SETTING('MWWarning_C_warn_hidevirtual', '1'),
-            SETTING('MWWarning_C_warn_implicitconv', '1'),
-            SETTING('MWWarning_C_warn_impl_f2i_conv', '1'),
-            SETTING('MWWarning_C_warn_impl_s2u_conv', '1'),
-            SETTING('MWWarning_C_warn_impl_i2f_conv', '1'),
-            SETTING('MWWarning_C_warn_ptrintconv', '1'),
-            SETTING('MWWarning_C_warn_unusedvar', '1'),
-            SETTING('MWWarning_C_warn_unusedarg', '1'),
-            SETTING('MWWarning_C_warn_resultnotused', '0'),
-            SETTING('MWWarning_C_warn_missingreturn', '1'),
-            SETTING('MWWarning_C_warn_no_side_effect', '1'),
-            SETTING('MWWarning_C_warn_extracomma', '1'),
-            SETTING('MWWarning_C_warn_structclass', '1'),
-            SETTING('MWWarning_C_warn_emptydecl', '1'),
-            SETTING('MWWarning_C_warn_filenamecaps', '0'),
-            SETTING('MWWarning_C_warn_filenamecapssystem', '0'),
-            SETTING('MWWarning_C_warn_padding', '0'),
-            SETTING('MWWarning_C_warn_undefmacro', '0'),
-            SETTING('MWWarning_C_warn_notinlined', '0'),
-            SETTING('MWWarning_C_warningerrors', '0')
-        ]
+        self.settings = _MWWARNING_C_SETTINGS
 
     def generate(self, line_list, level=4):
-        for item in self.settings:
-            item.generate(line_list, level)
+        self.settings.generate(line_list, level)
 
 
 class MWCodeGen_X86(object):
@@ -370,62 +411,73 @@ class GlobalOptimizer_X86(object):
             item.generate(line_list, level)
 
 
+## Settings for PDisasmX86, they are the same for every target
+_PDISASMX86_SETTINGS = StaticSettings((
+    ('PDisasmX86_showHeaders', 'true'),
+    ('PDisasmX86_showSectHeaders', 'true'),
+    ('PDisasmX86_showSymTab', 'true'),
+    ('PDisasmX86_showCode', 'true'),
+    ('PDisasmX86_showData', 'true'),
+    ('PDisasmX86_showDebug', 'false'),
+    ('PDisasmX86_showExceptions', 'false'),
+    ('PDisasmX86_showRelocation', 'true'),
+    ('PDisasmX86_showRaw', 'false'),
+    ('PDisasmX86_showAllRaw', 'false'),
+    ('PDisasmX86_showSource', 'false'),
+    ('PDisasmX86_showHex', 'true'),
+    ('PDisasmX86_showComments', 'false'),
+    ('PDisasmX86_resolveLocals', 'false'),
+    ('PDisasmX86_resolveRelocs', 'true'),
+    ('PDisasmX86_showSymDefs', 'true'),
+    ('PDisasmX86_unmangle', 'false'),
+    ('PDisasmX86_verbose', 'false')))
+
+
 class PDisasmX86(object):
     def __init__(self):
-        self.settings = [
-            SETTING('PDisasmX86_showHeaders', 'true'),
-            SETTING('PDisasmX86_showSectHeaders', 'true'),
-            SETTING('PDisasmX86_showSymTab', 'true'),
-            SETTING('PDisasmX86_showCode', 'true'),
-            SETTING('PDisasmX86_showData', 'true'),
-            SETTING('PDisasmX86_showDebug', 'false'),
-            SETTING('PDisasmX86_showExceptions', 'false'),
-            SETTING('PDisasmX86_showRelocation', 'true'),
-            SETTING('PDisasmX86_showRaw', 'false'),
-            SETTING('PDisasmX86_showAllRaw', 'false'),
-            SETTING('PDisasmX86_showSource', 'false'),
-            SETTING('PDisasmX86_showHex', 'true'),
-            SETTING('PDisasmX86_showComments', 'false'),
-            SETTING('PDisasmX86_resolveLocals', 'false'),
-            SETTING('PDisasmX86_resolveRelocs', 'true'),
-            SETTING('PDisasmX86_showSymDefs', 'true'),
-            SETTING('PDisasmX86_unmangle', 'false'),
-            SETTING('PDisasmX86_verbose', 'false')
-        ]
+        self.settings = _PDISASMX86_SETTINGS
 
     def generate(self, line_list, level=4):
-        for item in self.settings:
-            item.generate(line_list, level)
+        self.settings.generate(line_list, level)
+
+
+## Settings for MWLinker_X86, they are the same for every target
+_MWLINKER_X86_SETTINGS = StaticSettings((
+    ('MWLinker_X86_runtime', 'Custom'),
+    ('MWLinker_X86_linksym', '0'),
+    ('MWLinker_X86_linkCV', '1'),
+    ('MWLinker_X86_symfullpath', 'false'),
+    ('MWLinker_X86_linkdebug', 'true'),
+    ('MWLinker_X86_debuginline', 'true'),
+    ('MWLinker_X86_subsystem', 'Unknown'),
+    ('MWLinker_X86_entrypointusage', 'Default'),
+    ('MWLinker_X86_entrypoint', ''),
+    ('MWLinker_X86_codefolding', 'Any'),
+    ('MWLinker_X86_usedefaultlibs', 'true'),
+    ('MWLinker_X86_adddefaultlibs', 'false'),
+    ('MWLinker_X86_mergedata', 'true'),
+    ('MWLinker_X86_zero_init_bss', 'false'),
+    ('MWLinker_X86_generatemap', '0'),
+    ('MWLinker_X86_checksum', 'false'),
+    ('MWLinker_X86_linkformem', 'false'),
+    ('MWLinker_X86_nowarnings', 'false'),
+    ('MWLinker_X86_verbose', 'false'),
+    ('MWLinker_X86_commandfile', '')))
 
 
 class MWLinker_X86(object):
     def __init__(self):
-        self.settings = [
-            SETTING('MWLinker_X86_runtime', 'Custom'),
-            SETTING('MWLinker_X86_linksym', '0'),
-            SETTING('MWLinker_X86_linkCV', '1'),
-            SETTING('MWLinker_X86_symfullpath', 'false'),
-            SETTING('MWLinker_X86_linkdebug', 'true'),
-            SETTING('MWLinker_X86_debuginline', 'true'),
-            SETTING('MWLinker_X86_subsystem', 'Unknown'),
-            SETTING('MWLinker_X86_entrypointusage', 'Default'),
-            SETTING('MWLinker_X86_entrypoint', ''),
-            SETTING('MWLinker_X86_codefolding', 'Any'),
-            SETTING('MWLinker_X86_usedefaultlibs', 'true'),
-            SETTING('MWLinker_X86_adddefaultlibs', 'false'),
-            SETTING('MWLinker_X86_mergedata', 'true'),
-            SETTING('MWLinker_X86_zero_init_bss', 'false'),
-            SETTING('MWLinker_X86_generatemap', '0'),
-            SETTING('MWLinker_X86_checksum', 'false'),
-            SETTING('MWLinker_X86_linkformem', 'false'),
-            SETTING('MWLinker_X86_nowarnings', 'false'),
-            SETTING('MWLinker_X86_verbose', 'false'),
-            SETTING('MWLinker_X86_commandfile', '')
-        ]
+        self.settings = _MWLINKER_X86_SETTINGS
 
     def generate(self, line_list, level=4):
-        for item in self.settings:
-            item.generate(line_list, level)
+        self.settings.generate(line_list, level)
+
+
+## File suffixes that are linked as libraries
+_LIBRARY_SUFFIXES = ('.lib', '.a')
+
+## File suffixes that get debug information in non Release targets
+_DEBUG_SUFFIXES = ('.c', '.cpp')
 
 
 class FILE(object):
@@ -438,24 +490,35 @@ class FILE(object):
             self.format = 'Unix'
 
         self.flags = ''
-        if self.filename.endswith('.lib') or self.filename.endswith('.a'):
+        if self.filename.endswith(_LIBRARY_SUFFIXES):
             self.kind = 'Library'
         else:
             self.kind = 'Text'
             if configuration != 'Release' and \
-                    self.filename.endswith(('.c', '.cpp')):
+                    self.filename.endswith(_DEBUG_SUFFIXES):
                 self.flags = 'Debug'
 
     def generate(self, line_list, level=4):
         tabs = TAB * level
-        tabs2 = tabs + TAB
-        line_list.append(tabs + '<FILE>')
-        line_list.append(tabs2 + '<PATHTYPE>Name</PATHTYPE>')
-        line_list.append(tabs2 + '<PATH>' + self.filename + '</PATH>')
-        line_list.append(tabs2 + '<PATHFORMAT>' + self.format + '</PATHFORMAT>')
-        line_list.append(tabs2 + '<FILEKIND>' + self.kind + '</FILEKIND>')
-        line_list.append(tabs2 + '<FILEFLAGS>' + self.flags + '</FILEFLAGS>')
-        line_list.append(tabs + '</FILE>')
+        self.write(line_list, tabs, tabs + TAB)
+
+    def write(self, line_list, tabs, tabs2):
+        """
+        Write out the record with the indentation already computed.
+
+        Args:
+            line_list: List of lines to append to.
+            tabs: Indentation for the FILE tags.
+            tabs2: Indentation for the entries inside the tags.
+        """
+        line_list.extend((
+            tabs + '<FILE>',
+            tabs2 + '<PATHTYPE>Name</PATHTYPE>',
+            tabs2 + '<PATH>' + escape_xml_cdata(self.filename) + '</PATH>',
+            tabs2 + '<PATHFORMAT>' + self.format + '</PATHFORMAT>',
+            tabs2 + '<FILEKIND>' + self.kind + '</FILEKIND>',
+            tabs2 + '<FILEFLAGS>' + self.flags + '</FILEFLAGS>',
+            tabs + '</FILE>'))
 
 
 class FILEREF(object):
@@ -470,17 +533,28 @@ class FILEREF(object):
 
     def generate(self, line_list, level=4):
         tabs = TAB * level
-        tabs2 = tabs + TAB
+        self.write(line_list, tabs, tabs + TAB)
+
+    def write(self, line_list, tabs, tabs2):
+        """
+        Write out the record with the indentation already computed.
+
+        Args:
+            line_list: List of lines to append to.
+            tabs: Indentation for the FILEREF tags.
+            tabs2: Indentation for the entries inside the tags.
+        """
         line_list.append(tabs + '<FILEREF>')
         if self.configuration is not None:
             line_list.append(tabs2 +
                              '<TARGETNAME>' +
-                             str(self.configuration) +
+                             escape_xml_cdata(str(self.configuration)) +
                              '</TARGETNAME>')
-        line_list.append(tabs2 + '<PATHTYPE>Name</PATHTYPE>')
-        line_list.append(tabs2 + '<PATH>' + self.filename + '</PATH>')
-        line_list.append(tabs2 + '<PATHFORMAT>' + self.format + '</PATHFORMAT>')
-        line_list.append(tabs + '</FILEREF>')
+        line_list.extend((
+            tabs2 + '<PATHTYPE>Name</PATHTYPE>',
+            tabs2 + '<PATH>' + escape_xml_cdata(self.filename) + '</PATH>',
+            tabs2 + '<PATHFORMAT>' + self.format + '</PATHFORMAT>',
+            tabs + '</FILEREF>'))
 
 #
 # Each file group
@@ -493,46 +567,72 @@ class GROUP(object):
         self.groups = []
         self.filerefs = []
 
+        # Lookups for the names already present, every file of every
+        # configuration is added, so avoid scanning the lists
+        self.group_dict = {}
+        self.filename_set = set()
+
     def addfileref(self, platform, configuration, filename):
         # Was this filename already in the list?
-        for item in self.filerefs:
-            if item.filename == filename:
-                return
+        if filename in self.filename_set:
+            return
         # Add to the list
+        self.filename_set.add(filename)
         self.filerefs.append(FILEREF(platform, configuration, filename))
 
     def addgroup(self, name):
-        for item in self.groups:
-            if item.name == name:
-                return item
-        item = GROUP(name)
-        self.groups.append(item)
+        item = self.group_dict.get(name)
+        if item is None:
+            item = GROUP(name)
+            self.group_dict[name] = item
+            self.groups.append(item)
         return item
 
     def generate(self, line_list, level=2):
         """
         Generate output
+
+        The tree is walked with a stack instead of recursion. The file
+        records and closing tag of a group are pushed as a block of lines
+        under its sub groups, so they are written once the sub groups are done.
         """
-        if level == 1:
-            groupstring = 'GROUPLIST'
-        else:
-            groupstring = 'GROUP'
-        tabs = TAB * level
-        entry = tabs + '<' + groupstring + '>'
-        if self.name is not None:
-            entry = entry + '<NAME>' + self.name + '</NAME>'
-        line_list.append(entry)
+        stack = [(self, level)]
+        while stack:
+            group, level = stack.pop()
 
-        groups = sorted(self.groups, key=operator.attrgetter('name'))
-        for item in groups:
-            item.generate(line_list, level + 1)
+            # Block of lines that finishes a group?
+            if level is None:
+                line_list.extend(group)
+                continue
+
+            if level == 1:
+                groupstring = 'GROUPLIST'
+            else:
+                groupstring = 'GROUP'
+            tabs = TAB * level
+            entry = tabs + '<' + groupstring + '>'
+            if group.name is not None:
+                entry = entry + '<NAME>' + \
+                    escape_xml_cdata(group.name) + '</NAME>'
+            line_list.append(entry)
 
-        filerefs = sorted(
-            self.filerefs,
-            key=lambda s: s.filename.lower())
-        for item in filerefs:
-            item.generate(line_list, level + 1)
-        line_list.append(tabs + '</' + groupstring + '>')
+            # The indentation is the same for every file in the group
+            tabs2 = tabs + TAB
+            tabs3 = tabs2 + TAB
+            tail = []
+            filerefs = sorted(
+                group.filerefs,
+                key=lambda s: s.filename.lower())
+            for item in filerefs:
+                item.write(tail, tabs2, tabs3)
+            tail.append(tabs + '</' + groupstring + '>')
+            stack.append((tail, None))
+
+            # Push the sub groups in reverse so they pop in sorted order
+            groups = sorted(group.groups, key=operator.attrgetter('name'))
+            level = level + 1
+            for item in reversed(groups):
+                stack.append((item, level))
 
 
 class SUBTARGET(object):
@@ -595,30 +695,37 @@ class TARGET(object):
         """
         tabs = TAB * level
         tabs2 = tabs + TAB
-        line_list.append(tabs + '<TARGET>')
-        line_list.append(tabs2 + '<NAME>' + str(self.name) + '</NAME>')
+        level2 = level + 2
+
+        # All the lines are joined when the file is saved, bind the append
+        append = line_list.append
+        append(tabs + '<TARGET>')
+        append(tabs2 + '<NAME>' + escape_xml_cdata(str(self.name)) + '</NAME>')
 
-        line_list.append(tabs2 + '<SETTINGLIST>')
+        append(tabs2 + '<SETTINGLIST>')
         for item in self.settinglist:
-            item.generate(line_list, level + 2)
-        line_list.append(tabs2 + '</SETTINGLIST>')
+            item.generate(line_list, level2)
+        append(tabs2 + '</SETTINGLIST>')
 
-        line_list.append(tabs2 + '<FILELIST>')
+        # The file records all share the same indentation
+        tabs3 = tabs2 + TAB
+        tabs4 = tabs3 + TAB
+        append(tabs2 + '<FILELIST>')
         for item in self.filelist:
-            item.generate(line_list, level + 2)
-        line_list.append(tabs2 + '</FILELIST>')
+            item.write(line_list, tabs3, tabs4)
+        append(tabs2 + '</FILELIST>')
 
-        line_list.append(tabs2 + '<LINKORDER>')
+        append(tabs2 + '<LINKORDER>')
         for item in self.linkorder:
-            item.generate(line_list, level + 2)
-        line_list.append(tabs2 + '</LINKORDER>')
+            item.write(line_list, tabs3, tabs4)
+        append(tabs2 + '</LINKORDER>')
 
-        line_list.append(tabs2 + '<SUBTARGETLIST>')
+        append(tabs2 + '<SUBTARGETLIST>')
         for item in self.subtargetlist:
-            item.generate(line_list, level + 2)
-        line_list.append(tabs2 + '</SUBTARGETLIST>')
+            item.generate(line_list, level2)
+        append(tabs2 + '</SUBTARGETLIST>')
 
-        line_list.append(tabs + '</TARGET>')
+        append(tabs + '</TARGET>')
 
 #
 # Each TARGETORDER entry
@@ -633,10 +740,84 @@ class ORDEREDTARGET(object):
         tabs = TAB * level
         line_list.append(tabs +
                          '<ORDEREDTARGET><NAME>' +
-                         str(self.target.name) +
+                         escape_xml_cdata(str(self.target.name)) +
                          '</NAME></ORDEREDTARGET>')
 
 
+## Default library folders for Windows targets
+_CW_WIN32_LIBRARY_FOLDERS = (
+    '$(CodeWarrior)/MSL',
+    '$(CodeWarrior)/Win32-x86 Support'
+)
+
+## Runtime library for Windows applications, indexed by the debug flag
+_CW_WIN32_RUNTIME_LIBRARY = {
+    False: 'MSL_All_x86.lib',
+    True: 'MSL_All_x86_D.lib'
+}
+
+## XML description template written at the start of every project
+_CODEWARRIOR_DOCTYPE = (
+    '',
+    '<!DOCTYPE PROJECT [',
+    '<!ELEMENT PROJECT (TARGETLIST, TARGETORDER, GROUPLIST, DESIGNLIST?)>',
+    '<!ELEMENT TARGETLIST (TARGET+)>',
+    '<!ELEMENT TARGET (NAME, SETTINGLIST, FILELIST?, LINKORDER?, SEGMENTLIST?, '
+    'OVERLAYGROUPLIST?, SUBTARGETLIST?, SUBPROJECTLIST?, FRAMEWORKLIST?, PACKAGEACTIONSLIST?)>',
+    '<!ELEMENT NAME (#PCDATA)>',
+    '<!ELEMENT USERSOURCETREETYPE (#PCDATA)>',
+    '<!ELEMENT PATH (#PCDATA)>',
+    '<!ELEMENT FILELIST (FILE*)>',
+    '<!ELEMENT FILE (PATHTYPE, PATHROOT?, ACCESSPATH?, PATH, PATHFORMAT?, '
+    'ROOTFILEREF?, FILEKIND?, FILEFLAGS?)>',
+    '<!ELEMENT PATHTYPE (#PCDATA)>',
+    '<!ELEMENT PATHROOT (#PCDATA)>',
+    '<!ELEMENT ACCESSPATH (#PCDATA)>',
+    '<!ELEMENT PATHFORMAT (#PCDATA)>',
+    '<!ELEMENT ROOTFILEREF (PATHTYPE, PATHROOT?, ACCESSPATH?, PATH, PATHFORMAT?)>',
+    '<!ELEMENT FILEKIND (#PCDATA)>',
+    '<!ELEMENT FILEFLAGS (#PCDATA)>',
+    '<!ELEMENT FILEREF (TARGETNAME?, PATHTYPE, PATHROOT?, ACCESSPATH?, PATH, PATHFORMAT?)>',
+    '<!ELEMENT TARGETNAME (#PCDATA)>',
+    '<!ELEMENT SETTINGLIST ((SETTING|PANELDATA)+)>',
+    '<!ELEMENT SETTING (NAME?, (VALUE|(SETTING+)))>',
+    '<!ELEMENT PANELDATA (NAME, VALUE)>',
+    '<!ELEMENT VALUE (#PCDATA)>',
+    '<!ELEMENT LINKORDER (FILEREF*)>',
+    '<!ELEMENT SEGMENTLIST (SEGMENT+)>',
+    '<!ELEMENT SEGMENT (NAME, ATTRIBUTES?, FILEREF*)>',
+    '<!ELEMENT ATTRIBUTES (#PCDATA)>',
+    '<!ELEMENT OVERLAYGROUPLIST (OVERLAYGROUP+)>',
+    '<!ELEMENT OVERLAYGROUP (NAME, BASEADDRESS, OVERLAY*)>',
+    '<!ELEMENT BASEADDRESS (#PCDATA)>',
+    '<!ELEMENT OVERLAY (NAME, FILEREF*)>',
+    '<!ELEMENT SUBTARGETLIST (SUBTARGET+)>',
+    '<!ELEMENT SUBTARGET (TARGETNAME, ATTRIBUTES?, FILEREF?)>',
+    '<!ELEMENT SUBPROJECTLIST (SUBPROJECT+)>',
+    '<!ELEMENT SUBPROJECT (FILEREF, SUBPROJECTTARGETLIST)>',
+    '<!ELEMENT SUBPROJECTTARGETLIST (SUBPROJECTTARGET*)>',
+    '<!ELEMENT SUBPROJECTTARGET (TARGETNAME, ATTRIBUTES?, FILEREF?)>',
+    '<!ELEMENT FRAMEWORKLIST (FRAMEWORK+)>',
+    '<!ELEMENT FRAMEWORK (FILEREF, DYNAMICLIBRARY?, VERSION?)>',
+    '<!ELEMENT PACKAGEACTIONSLIST (PACKAGEACTION+)>',
+    '<!ELEMENT PACKAGEACTION (#PCDATA)>',
+    '<!ELEMENT LIBRARYFILE (FILEREF)>',
+    '<!ELEMENT VERSION (#PCDATA)>',
+    '<!ELEMENT TARGETORDER (ORDEREDTARGET|ORDEREDDESIGN)*>',
+    '<!ELEMENT ORDEREDTARGET (NAME)>',
+    '<!ELEMENT ORDEREDDESIGN (NAME, ORDEREDTARGET+)>',
+    '<!ELEMENT GROUPLIST (GROUP|FILEREF)*>',
+    '<!ELEMENT GROUP (NAME, (GROUP|FILEREF)*)>',
+    '<!ELEMENT DESIGNLIST (DESIGN+)>',
+    '<!ELEMENT DESIGN (NAME, DESIGNDATA)>',
+    '<!ELEMENT DESIGNDATA (#PCDATA)>',
+    ']>',
+    ''
+)
+
+########################################
+
+
 class Project(object):
     """
     Root object for an CodeWarrior IDE project file.
@@ -690,13 +871,19 @@ class Project(object):
             self.configuration_list.extend(project.configuration_list)
 
             # Get the source files that are compatible
-            listh = source_file_filter(project.codefiles, FileTypes.h)
-            listcpp = source_file_filter(project.codefiles, FileTypes.cpp)
-            listwindowsresource = []
+            buckets = source_file_buckets(
+                project.codefiles,
+                (FileTypes.h, FileTypes.cpp, FileTypes.rc))
+            alllists = buckets[FileTypes.h] + buckets[FileTypes.cpp]
             if project.platform.is_windows():
-                listwindowsresource = source_file_filter(
-                    project.codefiles, FileTypes.rc)
-            alllists = listh + listcpp + listwindowsresource
+                alllists += buckets[FileTypes.rc]
+
+            # Split the paths once, they are the same for every configuration
+            file_parts = []
+            for item in alllists:
+                parts = convert_to_linux_slashes(
+                    item.relative_pathname).split('/')
+                file_parts.append((unicode(parts[-1]), parts))
 
             # Select the project linker for the platform
             if project.platform.is_windows():
@@ -708,15 +895,12 @@ class Project(object):
             for configuration in project.configuration_list:
                 if not configuration.library_folders_list:
                     if project.platform.is_windows():
-                        configuration.library_folders_list = [
-                            '$(CodeWarrior)/MSL', '$(CodeWarrior)/Win32-x86 Support']
+                        configuration.library_folders_list = list(
+                            _CW_WIN32_LIBRARY_FOLDERS)
                         if not configuration.project_type.is_library():
-                            if configuration.debug:
-                                configuration.libraries_list.append(
-                                    'MSL_All_x86_D.lib')
-                            else:
-                                configuration.libraries_list.append(
-                                    'MSL_All_x86.lib')
+                            debug = bool(configuration.debug)
+                            configuration.libraries_list.append(
+                                _CW_WIN32_RUNTIME_LIBRARY[debug])
 
                 configuration.cw_name = configuration.name
 
@@ -788,14 +972,15 @@ class Project(object):
                 # Windows settings
                 if configuration.platform.is_windows():
 
-                    # x86 Target
+                    # x86 Target, use the IDE code computed by
+                    # Solution.generate()
                     target.settinglist.append(
                         MWProject_X86(
                             configuration.project_type,
-                            solution.name +
-                            solution.ide.get_short_code() +
-                            'w32' +
-                            configuration.short_code))
+                            '{}{}w32{}'.format(
+                                solution.name,
+                                solution.ide_code,
+                                configuration.short_code)))
 
                     # x86 CodeGen
                     target.settinglist.append(MWCodeGen_X86(configuration.name))
@@ -822,40 +1007,35 @@ class Project(object):
                 # Generate the file and group lists
                 if alllists or liblist:
                     filelist = []
-                    for item in alllists:
-                        parts = convert_to_linux_slashes(
-                            item.relative_pathname).split('/')
-                        filelist.append(unicode(parts[len(parts) - 1]))
-                        # Add to file group
+                    for basename, parts in file_parts:
+                        filelist.append(basename)
+                        # Add to file group, addtogroups() consumes the list
                         self.addtogroups(
-                            configuration.platform, configuration.name, parts)
+                            configuration.platform, configuration.name,
+                            list(parts))
 
-                    filelist = sorted(filelist, key=unicode.lower)
+                    filelist.sort(key=unicode.lower)
                     for item in filelist:
-                        target.filelist.append(
-                            FILE(
-                                configuration.platform,
-                                configuration.name,
-                                item))
-                        target.linkorder.append(
-                            FILEREF(
-                                configuration.platform,
-                                None,
-                                item))
-
-                    # Sort case insensitive
-                    liblist = sorted(liblist, key=unicode.lower)
+                        file_record = FILE(
+                            configuration.platform,
+                            configuration.name,
+                            item)
+                        target.filelist.append(file_record)
+                        target.linkorder.append(FILEREF(
+                            configuration.platform, None,
+                            file_record.filename))
+
+                    # Sort case insensitive, the list is a private copy
+                    liblist.sort(key=unicode.lower)
                     for item in liblist:
-                        target.filelist.append(
-                            FILE(
-                                configuration.platform,
-                                configuration.name,
-                                item))
-                        target.linkorder.append(
-                            FILEREF(
-                                configuration.platform,
-                                None,
-                                item))
+                        file_record = FILE(
+                            configuration.platform,
+                            configuration.name,
+                            item)
+                        target.filelist.append(file_record)
+                        target.linkorder.append(FILEREF(
+                            configuration.platform, None,
+                            file_record.filename))
                         # Add to file group
                         self.addtogroups(
                             configuration.platform, configuration.name, [
@@ -913,67 +1093,12 @@ class Project(object):
             exportversion = '1.0.1'
             ideversion = '5.0'
 
-        line_list.append('<?codewarrior exportversion="' + exportversion +
-                         '" ideversion="' + ideversion + '" ?>')
+        line_list.append(
+            '<?codewarrior exportversion="{}" ideversion="{}" ?>'.format(
+                exportversion, ideversion))
 
         # Write out the XML description template
-        line_list.extend([
-            '',
-            '<!DOCTYPE PROJECT [',
-            '<!ELEMENT PROJECT (TARGETLIST, TARGETORDER, GROUPLIST, DESIGNLIST?)>',
-            '<!ELEMENT TARGETLIST (TARGET+)>',
-            '<!ELEMENT TARGET (NAME, SETTINGLIST, FILELIST?, LINKORDER?, SEGMENTLIST?, '
-            'OVERLAYGROUPLIST?, SUBTARGETLIST?, SUBPROJECTLIST?, FRAMEWORKLIST?, PACKAGEACTIONSLIST?)>',
-            '<!ELEMENT NAME (#PCDATA)>',
-            '<!ELEMENT USERSOURCETREETYPE (#PCDATA)>',
-            '<!ELEMENT PATH (#PCDATA)>',
-            '<!ELEMENT FILELIST (FILE*)>',
-            '<!ELEMENT FILE (PATHTYPE, PATHROOT?, ACCESSPATH?, PATH, PATHFORMAT?, '
-            'ROOTFILEREF?, FILEKIND?, FILEFLAGS?)>',
-            '<!ELEMENT PATHTYPE (#PCDATA)>',
-            '<!ELEMENT PATHROOT (#PCDATA)>',
-            '<!ELEMENT ACCESSPATH (#PCDATA)>',
-            '<!ELEMENT PATHFORMAT (#PCDATA)>',
-            '<!ELEMENT ROOTFILEREF (PATHTYPE, PATHROOT?, ACCESSPATH?, PATH, PATHFORMAT?)>',
-            '<!ELEMENT FILEKIND (#PCDATA)>',
-            '<!ELEMENT FILEFLAGS (#PCDATA)>',
-            '<!ELEMENT FILEREF (TARGETNAME?, PATHTYPE, PATHROOT?, ACCESSPATH?, PATH, PATHFORMAT?)>',
-            '<!ELEMENT TARGETNAME (#PCDATA)>',
-            '<!ELEMENT SETTINGLIST ((SETTING|PANELDATA)+)>',
-            '<!ELEMENT SETTING (NAME?, (VALUE|(SETTING+)))>',
-            '<!ELEMENT PANELDATA (NAME, VALUE)>',
-            '<!ELEMENT VALUE (#PCDATA)>',
-            '<!ELEMENT LINKORDER (FILEREF*)>',
-            '<!ELEMENT SEGMENTLIST (SEGMENT+)>',
-            '<!ELEMENT SEGMENT (NAME, ATTRIBUTES?, FILEREF*)>',
-            '<!ELEMENT ATTRIBUTES (#PCDATA)>',
-            '<!ELEMENT OVERLAYGROUPLIST (OVERLAYGROUP+)>',
-            '<!ELEMENT OVERLAYGROUP (NAME, BASEADDRESS, OVERLAY*)>',
-            '<!ELEMENT BASEADDRESS (#PCDATA)>',
-            '<!ELEMENT OVERLAY (NAME, FILEREF*)>',
-            '<!ELEMENT SUBTARGETLIST (SUBTARGET+)>',
-            '<!ELEMENT SUBTARGET (TARGETNAME, ATTRIBUTES?, FILEREF?)>',
-            '<!ELEMENT SUBPROJECTLIST (SUBPROJECT+)>',
-            '<!ELEMENT SUBPROJECT (FILEREF, SUBPROJECTTARGETLIST)>',
-            '<!ELEMENT SUBPROJECTTARGETLIST (SUBPROJECTTARGET*)>',
-            '<!ELEMENT SUBPROJECTTARGET (TARGETNAME, ATTRIBUTES?, FILEREF?)>',
-            '<!ELEMENT FRAMEWORKLIST (FRAMEWORK+)>',
-            '<!ELEMENT FRAMEWORK (FILEREF, DYNAMICLIBRARY?, VERSION?)>',
-            '<!ELEMENT PACKAGEACTIONSLIST (PACKAGEACTION+)>',
-            '<!ELEMENT PACKAGEACTION (#PCDATA)>',
-            '<!ELEMENT LIBRARYFILE (FILEREF)>',
-            '<!ELEMENT VERSION (#PCDATA)>',
-            '<!ELEMENT TARGETORDER (ORDEREDTARGET|ORDEREDDESIGN)*>',
-            '<!ELEMENT ORDEREDTARGET (NAME)>',
-            '<!ELEMENT ORDEREDDESIGN (NAME, ORDEREDTARGET+)>',
-            '<!ELEMENT GROUPLIST (GROUP|FILEREF)*>',
-            '<!ELEMENT GROUP (NAME, (GROUP|FILEREF)*)>',
-            '<!ELEMENT DESIGNLIST (DESIGN+)>',
-            '<!ELEMENT DESIGN (NAME, DESIGNDATA)>',
-            '<!ELEMENT DESIGNDATA (#PCDATA)>',
-            ']>',
-            ''
-        ])
+        line_list.extend(_CODEWARRIOR_DOCTYPE)
 
         # Start the project
         line_list.append('<PROJECT>')
@@ -1054,12 +1179,15 @@ def generate(solution):
                 solution.working_directory,
                 solution.codewarrior_filename)
 
-            perforce_edit(mcp_filename)
-            cwfile = os.path.join(cwfile, 'Bin', 'ide')
-            cmd = '"' + cwfile + '" /x "' + xml_filename + \
-                '" "' + mcp_filename + '" /s /c /q'
+            # Only check out the binary project if Perforce is in use and
+            # the file is locked, this avoids a server round trip otherwise
+            if solution.perforce and os.path.isfile(mcp_filename) and \
+                    is_write_protected(mcp_filename):
+                perforce_edit(mcp_filename, verbose=solution.verbose)
+            # Call the IDE directly, no shell is needed to parse the command
+            cmd = [os.path.join(cwfile, 'Bin', 'ide'), '/x', xml_filename,
+                   mcp_filename, '/s', '/c', '/q']
             if solution.verbose:
-                print(cmd)
-            error = subprocess.call(
-                cmd, cwd=os.path.dirname(xml_filename), shell=True)
+                print(' '.join(cmd))
+            error = subprocess.call(cmd, cwd=os.path.dirname(xml_filename))
     return error
@@ -154,6 +154,79 @@ def source_file_filter(file_list, file_type_list):
 ########################################
 
 
+def source_file_buckets(file_list, file_type_list):
+    """
+    Split the file list by type in a single pass.
+
+    Args:
+        file_list: list of SourceFile entries.
+        file_type_list: FileTypes to collect.
+    Returns:
+        dict of FileTypes to lists of matching SourceFile entries, every
+        requested type has an entry, even if it's empty.
+    See Also:
+        source_file_filter
+    """
+
+    buckets = {}
+    for file_type in file_type_list:
+        buckets[file_type] = []
+
+    for item in file_list:
+        bucket = buckets.get(item.type)
+        if bucket is not None:
+            bucket.append(item)
+    return buckets
+
+
+## Cache of IDETypes to generator modules, built on first use
+_IDE_GENERATORS = {}
+
+########################################
+
+
+def _get_generator(ide):
+    """
+    Find the generator module that handles an IDE.
+
+    On first use, a dict is built from the SUPPORTED_IDES tuples of
+    all of the generator modules so each following lookup is a single
+    dict access.
+
+    Args:
+        ide: IDETypes of the IDE to generate for.
+    Returns:
+        Module with generate() for the IDE or None if not supported.
+    """
+
+    # pylint: disable=import-outside-toplevel
+
+    if not _IDE_GENERATORS:
+        import makeprojects.watcom
+        import makeprojects.makefile
+        import makeprojects.visual_studio
+        import makeprojects.visual_studio_2010
+        import makeprojects.codewarrior
+        import makeprojects.xcode
+        import makeprojects.codeblocks
+
+        # The first generator in the list to support an IDE is used
+        for generator in (
+                makeprojects.visual_studio,
+                makeprojects.visual_studio_2010,
+                makeprojects.watcom,
+                makeprojects.makefile,
+                makeprojects.codewarrior,
+                makeprojects.xcode,
+                makeprojects.codeblocks):
+            for item in generator.SUPPORTED_IDES:
+                _IDE_GENERATORS.setdefault(item, generator)
+
+    return _IDE_GENERATORS.get(ide, None)
+
+########################################
+
+
 class Attributes:
     """
     Base class for Solution parts to unify common code
@@ -518,7 +591,7 @@ class Attributes:
 ########################################
 
 
-class SourceFile:
+class SourceFile(object):
     """
     Object for each input file to insert to a solution.
 
@@ -527,6 +600,10 @@ class SourceFile:
     for processing.
     """
 
+    ## One is created per source file, so use slots instead of a dict.
+    # vs_name is set by the Visual Studio 2003-2008 exporter.
+    __slots__ = ('relative_pathname', 'working_directory', 'type', 'vs_name')
+
     def __init__(self, relative_pathname, working_directory, filetype):
         """
         Default constructor.
@@ -577,19 +654,20 @@ class SourceFile:
             if index == -1:
                 return ''
 
-        # Remove the basename
-        group_name = self.relative_pathname[:index]
-
-        # If there are ..\\ at the beginning, remove them
-
-        while group_name.startswith('..' + slash):
-            group_name = group_name[3:]
+        # Skip over any ..\\ prefixes, the basename is at index
+        relative_pathname = self.relative_pathname
+        start = 0
+        prefix = '..' + slash
+        while relative_pathname.startswith(prefix, start, index):
+            start += 3
 
-        # If there is a .\\, remove the single prefix
-        while group_name.startswith('.' + slash):
-            group_name = group_name[2:]
+        # If there is a .\\, skip the prefix
+        prefix = '.' + slash
+        while relative_pathname.startswith(prefix, start, index):
+            start += 2
 
-        return group_name
+        # Only create a single string for the result
+        return relative_pathname[start:index]
 
     def get_abspath(self):
         """
@@ -959,11 +1037,14 @@ class Project(Attributes):
                              "must be of type Configuration"))
             # Set the configuration's parent
 
-        if configuration.platform is None:
-            configuration.platform = PlatformTypes.default()
+        # The platform is a chained value, only look it up once
+        platform_type = configuration.platform
+        if platform_type is None:
+            platform_type = PlatformTypes.default()
+            configuration.platform = platform_type
 
-        if configuration.platform.is_expandable():
-            for platform in configuration.platform.get_expanded():
+        if platform_type.is_expandable():
+            for platform in platform_type.get_expanded():
                 config = deepcopy(configuration)
                 config.platform = platform
                 config.project = self
@@ -1079,14 +1160,15 @@ class Project(Attributes):
 
     ########################################
 
-    def _scan_directory(self, working_directory, recurse, acceptable_list):
+    def _scan_directory(self, working_directory, recurse, acceptable_set):
         """
         Given a base directory and a relative directory
         scan for all the files that are to be included in the project
 
         Args:
             working_directory: Directory to scan
-            file_list: list to store SourceFile records
+            recurse: True to scan sub directories
+            acceptable_set: frozenset of acceptable FileTypes
         """
 
         # Absolute or relative?
@@ -1099,47 +1181,54 @@ class Project(Attributes):
         if not os.path.isdir(working_directory):
             return
 
+        # Bind the loop invariants once instead of looking them up per file
+        root_directory = self.working_directory
+        exclude_list_regex = self.exclude_list_regex
+        file_list_append = self.file_list.append
+        isfile = os.path.isfile
+        relpath = os.path.relpath
+
+        # Directory with a trailing separator, so each file name is a
+        # single concatenation
+        dir_prefix = os.path.join(working_directory, '')
+
+        # Relative name of this directory for header search, created on demand
+        include_name = None
+
         # Scan the directory
         for base_name in os.listdir(working_directory):
 
             # Is this file in the exclusion list?
-            for item in self.exclude_list_regex:
+            for item in exclude_list_regex:
                 if item(base_name):
                     break
             else:
 
-                # Is it a file? (Skip links and folders)
-                file_name = os.path.join(working_directory, base_name)
-                if os.path.isfile(file_name):
-
-                    # Check against the extension list (Skip if not
-                    # supported)
-                    file_type = FileTypes.lookup(base_name)
-                    if file_type is None:
-                        continue
-
-                    # Found a match, test if the type is in
-                    # the acceptable list
-
-                    if file_type in acceptable_list:
-                        # Create a new entry (Using windows style slashes
-                        # for consistency)
-                        self.file_list.append(SourceFile(
-                            os.path.relpath(
-                                file_name,
-                                self.working_directory),
-                            working_directory,
-                            file_type))
-
-                        # Add the directory the file was found for header search
-                        self.include_list.add(
-                            os.path.relpath(
-                                working_directory, self.working_directory))
+                # Check against the extension list first, so unsupported
+                # files are rejected without a call to the file system
+                file_type = FileTypes.lookup(base_name)
+                file_name = dir_prefix + base_name
+
+                # Found a match in the acceptable list, is it a file?
+                # (Skip links and folders)
+                if file_type in acceptable_set and isfile(file_name):
+                    # Create a new entry (Using windows style slashes
+                    # for consistency)
+                    file_list_append(SourceFile(
+                        relpath(file_name, root_directory),
+                        working_directory,
+                        file_type))
+
+                    # Add the directory the file was found for header search
+                    if include_name is None:
+                        include_name = relpath(
+                            working_directory, root_directory)
+                        self.include_list.add(include_name)
 
                 # Process folders only if in recursion mode
                 elif recurse and os.path.isdir(file_name):
                     self._scan_directory(
-                        file_name, recurse, acceptable_list)
+                        file_name, recurse, acceptable_set)
 
     ########################################
 
@@ -1152,7 +1241,8 @@ class Project(Attributes):
         working directory folders where the source code was found.
 
         - ``exclude_list`` for wildcard matching for files to exclude
-        - ``source_folders_list`` for list of folders to search for source code
+        - ``source_folders_list`` for list of folders to search for source
+          code, folders ending with ``/*.*`` are scanned recursively
         - ``source_files_list`` list of files to add
         Args:
             acceptable_list: List of acceptable FileTypes
@@ -1160,6 +1250,9 @@ class Project(Attributes):
 
         # pylint: disable=attribute-defined-outside-init
 
+        # Hash the types once, every file found is tested against them
+        acceptable_set = frozenset(acceptable_list)
+
         # Get the files to exclude in this
         self.exclude_list_regex = translate_to_regex_match(
             self.get_unique_chained_list('exclude_list'))
@@ -1185,7 +1278,7 @@ class Project(Attributes):
             # Found a match, test if the type is in
             # the acceptable list
 
-            if file_type in acceptable_list:
+            if file_type in acceptable_set:
                 # Create a new entry (Using windows style slashes
                 # for consistency)
                 self.file_list.append(SourceFile(
@@ -1211,7 +1304,7 @@ class Project(Attributes):
                 recurse = True
 
             # Scan the folder for files
-            self._scan_directory(item, recurse, acceptable_list)
+            self._scan_directory(item, recurse, acceptable_set)
 
         # Since the slashes are all windows (No matter what
         # host this script is running on, the sort will yield consistent
@@ -1481,8 +1574,6 @@ class Solution(Attributes):
         Generate a project file and write it out to disk.
         """
 
-        # pylint: disable=import-outside-toplevel
-
         # Work from a copy to ensure the original is not touched.
         solution = deepcopy(self)
 
@@ -1501,27 +1592,8 @@ class Solution(Attributes):
             solution.ide = ide
 
         # Determine which generator to use based on the selected IDE
-
-        import makeprojects.watcom
-        import makeprojects.makefile
-        import makeprojects.visual_studio
-        import makeprojects.visual_studio_2010
-        import makeprojects.codewarrior
-        import makeprojects.xcode
-        import makeprojects.codeblocks
-
-        generator_list = (
-            makeprojects.visual_studio,
-            makeprojects.visual_studio_2010,
-            makeprojects.watcom,
-            makeprojects.makefile,
-            makeprojects.codewarrior,
-            makeprojects.xcode,
-            makeprojects.codeblocks)
-        for generator in generator_list:
-            if ide in generator.SUPPORTED_IDES:
-                break
-        else:
+        generator = _get_generator(ide)
+        if generator is None:
             print('IDE {} is not supported.'.format(ide))
             return 10
 
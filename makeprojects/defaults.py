@@ -44,6 +44,19 @@ _CONFIGURATION_DEFAULTS = {
         'analyze': True}
 }
 
+## Default IDE for game platforms, in order of priority
+_PLATFORM_DEFAULT_IDES = (
+    (PlatformTypes.xbox, IDETypes.vs2003),
+    (PlatformTypes.xbox360, IDETypes.vs2010),
+    (PlatformTypes.xboxone, IDETypes.vs2017),
+    (PlatformTypes.ps3, IDETypes.vs2015),
+    (PlatformTypes.ps4, IDETypes.vs2015),
+    (PlatformTypes.vita, IDETypes.vs2015),
+    (PlatformTypes.shield, IDETypes.vs2015),
+    (PlatformTypes.wiiu, IDETypes.vs2015),
+    (PlatformTypes.switch, IDETypes.vs2017)
+)
+
 ########################################
 
 
@@ -102,14 +115,13 @@ def get_project_name(build_rules_list, working_directory, args):
 
     project_name = args.name
     if not project_name:
-        # Check build_rules.py
-        for rules in build_rules_list:
-            project_name = rules(
-                'default_project_name',
-                working_directory=working_directory)
-            if project_name:
-                break
-        else:
+        # Check build_rules.py, the first name found is used
+        project_name = next(
+            (item for item in (
+                rules('default_project_name',
+                      working_directory=working_directory)
+                for rules in build_rules_list) if item), None)
+        if not project_name:
             # Use the default
             project_name = default_rules(
                 'default_project_name', working_directory)
@@ -209,14 +221,21 @@ def get_ide_list(build_rules_list, working_directory, args):
                 temp_list = convert_to_array(default)
                 break
 
-    # Convert strings to IDETypes.
+    # Convert strings to IDETypes, remove duplicates so projects are
+    # only generated once
     ide_list = []
+    ide_seen = set()
+    unsupported = []
     for item in temp_list:
         ide_type = IDETypes.lookup(item)
         if ide_type is None:
-            print('IDE {} is not supported.'.format(item))
-        else:
+            unsupported.append(item)
+        elif ide_type not in ide_seen:
+            ide_seen.add(ide_type)
             ide_list.append(ide_type)
+    if unsupported:
+        print('\n'.join(
+            'IDE {} is not supported.'.format(item) for item in unsupported))
 
     # Print if needed.
     if args.verbose:
@@ -265,14 +284,22 @@ def get_platform_list(build_rules_list, working_directory, args):
                 temp_list = convert_to_array(default)
                 break
 
-    # Convert strings to PlatformTypes.
+    # Convert strings to PlatformTypes, remove duplicates so projects are
+    # only generated once
     platform_list = []
+    platform_seen = set()
+    unsupported = []
     for item in temp_list:
         platform_type = PlatformTypes.lookup(item)
         if platform_type is None:
-            print('Platform {} is not supported.'.format(item))
-        else:
+            unsupported.append(item)
+        elif platform_type not in platform_seen:
+            platform_seen.add(platform_type)
             platform_list.append(platform_type)
+    if unsupported:
+        print('\n'.join(
+            'Platform {} is not supported.'.format(item)
+            for item in unsupported))
 
     # Print if needed.
     if args.verbose:
@@ -352,9 +379,6 @@ def fixup_ide_platform(ide_list, platform_list):
         platform_list: List of platforms to build for.
     """
 
-    # Too many branches
-    # pylint: disable=R0912
-
     # If no platform and IDE were selected, use the system defaults
     if not platform_list and not ide_list:
         platform_list.append(PlatformTypes.default())
@@ -369,32 +393,11 @@ def fixup_ide_platform(ide_list, platform_list):
     elif not ide_list:
         # Platform without an IDE is tricky, because video game platforms
         # are picky.
-        if PlatformTypes.xbox in platform_list:
-            ide_list.append(IDETypes.vs2003)
-
-        elif PlatformTypes.xbox360 in platform_list:
-            ide_list.append(IDETypes.vs2010)
-
-        elif PlatformTypes.xboxone in platform_list:
-            ide_list.append(IDETypes.vs2017)
-
-        elif PlatformTypes.ps3 in platform_list:
-            ide_list.append(IDETypes.vs2015)
-
-        elif PlatformTypes.ps4 in platform_list:
-            ide_list.append(IDETypes.vs2015)
-
-        elif PlatformTypes.vita in platform_list:
-            ide_list.append(IDETypes.vs2015)
-
-        elif PlatformTypes.shield in platform_list:
-            ide_list.append(IDETypes.vs2015)
-
-        elif PlatformTypes.wiiu in platform_list:
-            ide_list.append(IDETypes.vs2015)
-
-        elif PlatformTypes.switch in platform_list:
-            ide_list.append(IDETypes.vs2017)
+        platform_set = set(platform_list)
+        for platform, ide in _PLATFORM_DEFAULT_IDES:
+            if platform in platform_set:
+                ide_list.append(ide)
+                break
 
         # Unknown, punt on the IDE
         else:
@@ -19,13 +19,65 @@ All enumerations are stored in this package
 
 from __future__ import absolute_import, print_function, unicode_literals
 from enum import IntEnum
-import os
 from burger import get_mac_host_type, get_windows_host_type, \
     where_is_visual_studio, where_is_codeblocks, where_is_watcom, where_is_xcode
 
 ########################################
 
 
+def _create_lookup(enum_type, name_table, specials=None):
+    """
+    Create a dictionary to find an enumeration by a lower case name.
+
+    Member names have the highest priority, followed by the names in
+    name_table in order, then the special names. The first enumeration to
+    claim a name keeps it.
+
+    Args:
+        enum_type: Enumeration class to scan for member names.
+        name_table: Iterable of (enumeration, iterable of names).
+        specials: dict of extra lower case names.
+    Returns:
+        dict of lower case names to enumerations.
+    """
+
+    result = {}
+    for item in enum_type:
+        result[item.name.lower()] = item
+
+    for item, names in name_table:
+        for name in names:
+            result.setdefault(name.lower(), item)
+
+    if specials:
+        for name, item in specials.items():
+            result.setdefault(name, item)
+    return result
+
+########################################
+
+
+def _set_member_attribute(enum_type, name, table, default=None):
+    """
+    Store a value from a table in every member of an enumeration.
+
+    Members that are not in the table are set to the default, so reading the
+    attribute works like table.get(member, default) without hashing the
+    member.
+
+    Args:
+        enum_type: Enumeration class to update.
+        name: Name of the attribute to set.
+        table: dict of members to values.
+        default: Value for members that are not in the table.
+    """
+
+    for item in enum_type:
+        setattr(item, name, table.get(item, default))
+
+########################################
+
+
 class FileTypes(IntEnum):
     """
     Enumeration of supported file types for project input
@@ -105,8 +157,13 @@ class FileTypes(IntEnum):
             makeprojects.enums._FILETYPES_LOOKUP
         """
 
-        return _FILETYPES_LOOKUP.get(
-            os.path.splitext(test_name)[1][1:].strip().lower(), None)
+        # Split on the last period, it's a single pass in C
+        base_name, period, extension = test_name.rpartition('.')
+
+        # No extension or a name with only leading periods, like ".txt"
+        if not period or not base_name.lstrip('.'):
+            return None
+        return _FILETYPES_LOOKUP.get(extension.strip().lower(), None)
 
     def __repr__(self):
         """
@@ -118,7 +175,7 @@ class FileTypes(IntEnum):
             makeprojects.enums._FILETYPES_READABLE
         """
 
-        return _FILETYPES_READABLE.get(self, None)
+        return self._readable
 
     ## Allow str() to work.
     __str__ = __repr__
@@ -217,6 +274,9 @@ _FILETYPES_READABLE = {
     FileTypes.icns: 'macOS Icon file'
 }
 
+# Store the strings in the members for __repr__()
+_set_member_attribute(FileTypes, '_readable', _FILETYPES_READABLE)
+
 ########################################
 
 
@@ -249,7 +309,7 @@ class ProjectTypes(IntEnum):
             True if the project is a static or dynamic library.
         """
 
-        return self in (ProjectTypes.library, ProjectTypes.sharedlibrary)
+        return self in _PROJECTTYPES_LIBRARIES
 
     @staticmethod
     def lookup(project_type_name):
@@ -273,25 +333,8 @@ class ProjectTypes(IntEnum):
             return project_type_name
 
         if project_type_name:
-            # Try the member name as is.
-            test_name = project_type_name.lower()
-            if hasattr(ProjectTypes, project_type_name):
-                return ProjectTypes[project_type_name]
-
-            # Try a number of ways to find a match
-            for item in _PROJECTTYPES_READABLE:
-                # Verbose name?
-                if test_name == str(item).lower():
-                    return item
-
-            specials = {
-                'lib': ProjectTypes.library,
-                'game': ProjectTypes.app,
-                'dll': ProjectTypes.sharedlibrary,
-                'console': ProjectTypes.tool,
-                'scr': ProjectTypes.screensaver
-            }
-            return specials.get(test_name, None)
+            # Member names, verbose names and special names
+            return _PROJECTTYPES_LOOKUP.get(project_type_name.lower(), None)
 
         return None
 
@@ -312,11 +355,17 @@ class ProjectTypes(IntEnum):
             makeprojects.enums._PROJECTTYPES_READABLE
         """
 
-        return _PROJECTTYPES_READABLE.get(self, None)
+        return self._readable
 
     ## Allow str() to work.
     __str__ = __repr__
 
+
+## Static and dynamic library project types
+_PROJECTTYPES_LIBRARIES = frozenset((
+    ProjectTypes.library,
+    ProjectTypes.sharedlibrary))
+
 ## List of human readable strings
 #
 # Dictionary to map ProjectTypes enumerations into an human readable string
@@ -333,6 +382,24 @@ _PROJECTTYPES_READABLE = {
     ProjectTypes.empty: 'Empty'
 }
 
+# Store the strings in the members for __repr__()
+_set_member_attribute(ProjectTypes, '_readable', _PROJECTTYPES_READABLE)
+
+## Dictionary of lower case names to ProjectTypes
+#
+# @sa makeprojects.enums.ProjectTypes.lookup()
+
+_PROJECTTYPES_LOOKUP = _create_lookup(
+    ProjectTypes,
+    ((item, (name,)) for item, name in _PROJECTTYPES_READABLE.items()),
+    {
+        'lib': ProjectTypes.library,
+        'game': ProjectTypes.app,
+        'dll': ProjectTypes.sharedlibrary,
+        'console': ProjectTypes.tool,
+        'scr': ProjectTypes.screensaver
+    })
+
 
 ########################################
 
@@ -420,7 +487,7 @@ class IDETypes(IntEnum):
             makeprojects.enums._IDETYPES_CODES
         """
 
-        return _IDETYPES_CODES.get(self, None)
+        return self._short_code
 
     def is_visual_studio(self):
         """
@@ -430,10 +497,7 @@ class IDETypes(IntEnum):
             True if the platform is Microsoft Visual Studio.
         """
 
-        return self in (
-            IDETypes.vs2003, IDETypes.vs2005, IDETypes.vs2008, IDETypes.vs2010,
-            IDETypes.vs2012, IDETypes.vs2013, IDETypes.vs2015, IDETypes.vs2017,
-            IDETypes.vs2019)
+        return self in _IDETYPES_VISUAL_STUDIO
 
     def is_xcode(self):
         """
@@ -443,10 +507,7 @@ class IDETypes(IntEnum):
             True if the platform is Apple XCode.
         """
 
-        return self in (
-            IDETypes.xcode3, IDETypes.xcode4, IDETypes.xcode5, IDETypes.xcode6,
-            IDETypes.xcode7, IDETypes.xcode8, IDETypes.xcode9, IDETypes.xcode10,
-            IDETypes.xcode11)
+        return self in _IDETYPES_XCODE
 
     def is_codewarrior(self):
         """
@@ -456,8 +517,7 @@ class IDETypes(IntEnum):
             True if the platform is Metrowerks / Freescale Codewarrior.
         """
 
-        return self in (IDETypes.codewarrior50,
-                        IDETypes.codewarrior58, IDETypes.codewarrior59)
+        return self in _IDETYPES_CODEWARRIOR
 
     @staticmethod
     def lookup(ide_name):
@@ -484,17 +544,10 @@ class IDETypes(IntEnum):
             return ide_name
 
         if ide_name:
-            # Try the member name as is.
-            test_name = ide_name.lower()
-            if hasattr(IDETypes, test_name):
-                return IDETypes[test_name]
-
-            # Try a number of ways to find a match
-            for item in _IDETYPES_READABLE:
-                # Verbose name? File name short code?
-                if test_name == str(item).lower(
-                ) or test_name == _IDETYPES_CODES[item]:
-                    return item
+            # Member name? Verbose name? File name short code?
+            item = _IDETYPES_LOOKUP.get(ide_name.lower(), None)
+            if item is not None:
+                return item
 
             # Try some generic names and perform magic to figure out the IDE
             if ide_name in ('vs', 'visualstudio',
@@ -513,6 +566,18 @@ class IDETypes(IntEnum):
     def default():
         """
         Determine the default IDETypes from the currently running platform.
+
+        The host is only searched on the first call.
+        """
+
+        if 'ide_default' not in _HOST_SEARCHES:
+            _HOST_SEARCHES['ide_default'] = IDETypes._find_default()
+        return _HOST_SEARCHES['ide_default']
+
+    @staticmethod
+    def _find_default():
+        """
+        Search the host for the value returned by default().
         """
 
         # Windows host?
@@ -545,12 +610,42 @@ class IDETypes(IntEnum):
             makeprojects.enums._IDETYPES_READABLE
         """
 
-        return _IDETYPES_READABLE.get(self, None)
+        return self._readable
 
     ## Allow str() to work.
     __str__ = __repr__
 
 
+## Versions of Microsoft Visual Studio
+_IDETYPES_VISUAL_STUDIO = frozenset((
+    IDETypes.vs2003,
+    IDETypes.vs2005,
+    IDETypes.vs2008,
+    IDETypes.vs2010,
+    IDETypes.vs2012,
+    IDETypes.vs2013,
+    IDETypes.vs2015,
+    IDETypes.vs2017,
+    IDETypes.vs2019))
+
+## Versions of Apple XCode
+_IDETYPES_XCODE = frozenset((
+    IDETypes.xcode3,
+    IDETypes.xcode4,
+    IDETypes.xcode5,
+    IDETypes.xcode6,
+    IDETypes.xcode7,
+    IDETypes.xcode8,
+    IDETypes.xcode9,
+    IDETypes.xcode10,
+    IDETypes.xcode11))
+
+## Versions of Metrowerks / Freescale CodeWarrior
+_IDETYPES_CODEWARRIOR = frozenset((
+    IDETypes.codewarrior50,
+    IDETypes.codewarrior58,
+    IDETypes.codewarrior59))
+
 ## List of IDE short codes
 #
 # Dictionary to map IDETypes enumerations into a
@@ -588,6 +683,9 @@ _IDETYPES_CODES = {
     IDETypes.mpw: 'mpw'                     # MPW Make
 }
 
+# Store the codes in the members for get_short_code()
+_set_member_attribute(IDETypes, '_short_code', _IDETYPES_CODES)
+
 ## List of human readable strings
 #
 # Dictionary to map IDETypes enumerations into an human readable string
@@ -624,6 +722,74 @@ _IDETYPES_READABLE = {
     IDETypes.mpw: 'Apple MPW make'
 }
 
+# Store the strings in the members for __repr__()
+_set_member_attribute(IDETypes, '_readable', _IDETYPES_READABLE)
+
+## Dictionary of lower case names to IDETypes
+#
+# @sa makeprojects.enums.IDETypes.lookup()
+
+_IDETYPES_LOOKUP = _create_lookup(
+    IDETypes,
+    ((item, (name, _IDETYPES_CODES[item]))
+     for item, name in _IDETYPES_READABLE.items()))
+
+## Visual Studio versions to search for, newest first
+_VISUAL_STUDIO_VERSIONS = (
+    (2019, IDETypes.vs2019),
+    (2017, IDETypes.vs2017),
+    (2015, IDETypes.vs2015),
+    (2013, IDETypes.vs2013),
+    (2012, IDETypes.vs2012),
+    (2010, IDETypes.vs2010),
+    (2008, IDETypes.vs2008),
+    (2005, IDETypes.vs2005),
+    (2003, IDETypes.vs2003)
+)
+
+## XCode versions to search for, newest first
+_XCODE_VERSIONS = (
+    (11, IDETypes.xcode11),
+    (10, IDETypes.xcode10),
+    (9, IDETypes.xcode9),
+    (8, IDETypes.xcode8),
+    (7, IDETypes.xcode7),
+    (6, IDETypes.xcode6),
+    (5, IDETypes.xcode5),
+    (4, IDETypes.xcode4),
+    (3, IDETypes.xcode3)
+)
+
+## Results of searches of the host machine, they don't change during a run.
+# Keys are 'ide_default' for IDETypes.default(), 'platform_default' for
+# PlatformTypes.default(), 'visual_studio' for get_installed_visual_studio()
+# and 'xcode' for get_installed_xcode()
+_HOST_SEARCHES = {}
+
+########################################
+
+
+def _find_installed_ide(name, version_table, where_is):
+    """
+    Find the newest installed version of an IDE, only searching once.
+
+    Args:
+        name: Key for the result in _HOST_SEARCHES.
+        version_table: Tuple of (version, IDETypes), newest first.
+        where_is: Function to test if a version is installed.
+    Returns:
+        IDETypes value or None
+    """
+
+    if name not in _HOST_SEARCHES:
+        result = None
+        for version, ide in version_table:
+            if where_is(version):
+                result = ide
+                break
+        _HOST_SEARCHES[name] = result
+    return _HOST_SEARCHES[name]
+
 ########################################
 
 
@@ -638,21 +804,8 @@ def get_installed_visual_studio():
         IDETypes value or None
     """
 
-    vs_studio_table = (
-        (2019, IDETypes.vs2019),
-        (2017, IDETypes.vs2017),
-        (2015, IDETypes.vs2015),
-        (2013, IDETypes.vs2013),
-        (2012, IDETypes.vs2012),
-        (2010, IDETypes.vs2010),
-        (2008, IDETypes.vs2008),
-        (2005, IDETypes.vs2005),
-        (2003, IDETypes.vs2003)
-    )
-    for item in vs_studio_table:
-        if where_is_visual_studio(item[0]):
-            return item[1]
-    return None
+    return _find_installed_ide(
+        'visual_studio', _VISUAL_STUDIO_VERSIONS, where_is_visual_studio)
 
 
 ########################################
@@ -669,21 +822,7 @@ def get_installed_xcode():
         IDETypes value or None
     """
 
-    xcode_table = (
-        (11, IDETypes.xcode11),
-        (10, IDETypes.xcode10),
-        (9, IDETypes.xcode9),
-        (8, IDETypes.xcode8),
-        (7, IDETypes.xcode7),
-        (6, IDETypes.xcode6),
-        (5, IDETypes.xcode5),
-        (4, IDETypes.xcode4),
-        (3, IDETypes.xcode3)
-    )
-    for item in xcode_table:
-        if where_is_xcode(item[0]):
-            return item[1]
-    return None
+    return _find_installed_ide('xcode', _XCODE_VERSIONS, where_is_xcode)
 
 ########################################
 
@@ -835,7 +974,7 @@ class PlatformTypes(IntEnum):
             makeprojects.enums._PLATFORMTYPES_CODES
         """
 
-        return _PLATFORMTYPES_CODES.get(self, None)
+        return self._short_code
 
     def is_windows(self):
         """
@@ -845,10 +984,7 @@ class PlatformTypes(IntEnum):
             True if the platform is for Microsoft windows.
         """
 
-        return self in (PlatformTypes.windows, PlatformTypes.windowsintel,
-                        PlatformTypes.windowsarm, PlatformTypes.win32,
-                        PlatformTypes.win64, PlatformTypes.winarm32,
-                        PlatformTypes.winarm64, PlatformTypes.winitanium)
+        return self in _PLATFORMTYPES_WINDOWS
 
     def is_xbox(self):
         """
@@ -858,8 +994,7 @@ class PlatformTypes(IntEnum):
             True if the platform is for Xbox, Xbox 360, or Xbox ONE.
         """
 
-        return self in (PlatformTypes.xbox,
-                        PlatformTypes.xbox360, PlatformTypes.xboxone)
+        return self in _PLATFORMTYPES_XBOX
 
     def is_macosx(self):
         """
@@ -869,9 +1004,7 @@ class PlatformTypes(IntEnum):
             True if the platform is Apple macOS.
         """
 
-        return self in (PlatformTypes.macosx, PlatformTypes.macosxppc32,
-                        PlatformTypes.macosxppc64, PlatformTypes.macosxintel32,
-                        PlatformTypes.macosxintel64)
+        return self in _PLATFORMTYPES_MACOSX
 
     def is_ios(self):
         """
@@ -881,9 +1014,7 @@ class PlatformTypes(IntEnum):
             True if the platform is Apple iOS.
         """
 
-        return self in (PlatformTypes.ios, PlatformTypes.ios32,
-                        PlatformTypes.ios64, PlatformTypes.iosemu,
-                        PlatformTypes.iosemu32, PlatformTypes.iosemu64)
+        return self in _PLATFORMTYPES_IOS
 
     def is_macos(self):
         """
@@ -902,8 +1033,7 @@ class PlatformTypes(IntEnum):
         Returns:
             True if the platform is Apple MacOS Carbon API.
         """
-        return self in (PlatformTypes.maccarbon, PlatformTypes.maccarbon68k,
-                        PlatformTypes.maccarbonppc)
+        return self in _PLATFORMTYPES_MACOS_CARBON
 
     def is_macos_classic(self):
         """
@@ -912,8 +1042,7 @@ class PlatformTypes(IntEnum):
         Returns:
             True if the platform is Apple MacOS 1.0 through 9.2.2.
         """
-        return self in (PlatformTypes.macos9,
-                        PlatformTypes.macos968k, PlatformTypes.macos9ppc)
+        return self in _PLATFORMTYPES_MACOS_CLASSIC
 
     def is_msdos(self):
         """
@@ -922,8 +1051,7 @@ class PlatformTypes(IntEnum):
         Returns:
             True if the platform is MSDos
         """
-        return self in (PlatformTypes.msdos,
-                        PlatformTypes.msdos4gw, PlatformTypes.msdosx32)
+        return self in _PLATFORMTYPES_MSDOS
 
     def is_android(self):
         """
@@ -932,11 +1060,7 @@ class PlatformTypes(IntEnum):
         Returns:
             True if the platform is Android
         """
-        return self in (
-            PlatformTypes.android, PlatformTypes.shield, PlatformTypes.ouya,
-            PlatformTypes.amico, PlatformTypes.tegra,
-            PlatformTypes.androidarm32, PlatformTypes.androidarm64,
-            PlatformTypes.androidintel32, PlatformTypes.androidintel64)
+        return self in _PLATFORMTYPES_ANDROID
 
     def is_switch(self):
         """
@@ -945,8 +1069,7 @@ class PlatformTypes(IntEnum):
         Returns:
             True if the platform is Nintendo Switch
         """
-        return self in (PlatformTypes.switch,
-                        PlatformTypes.switch32, PlatformTypes.switch64)
+        return self in _PLATFORMTYPES_SWITCH
 
     def get_platform_folder(self):
         """
@@ -1006,40 +1129,16 @@ class PlatformTypes(IntEnum):
             True if the types are compatible.
         """
 
-        # Too many return statements
-        # Too many branches
-        # pylint: disable=R0911, R0912
         if self == second:
             return True
 
-        # Test using the windows wildcard
-        if self == PlatformTypes.windows or second == PlatformTypes.windows:
-            return self.is_windows() == second.is_windows()
-
-        # Test macosx
-        if self == PlatformTypes.macosx or second == PlatformTypes.macosx:
-            return self.is_macosx() == second.is_macosx()
-
-        # Test macos 1.0 - 9.2.2
-        if self == PlatformTypes.macos9 or second == PlatformTypes.macos9:
-            return self.is_macos_classic() == second.is_macos_classic()
-
-        # Test macos Carbon
-        if self == PlatformTypes.maccarbon or second == PlatformTypes.maccarbon:
-            return self.is_macos_carbon() == second.is_macos_carbon()
-
-        # Test iOS
-        if self == PlatformTypes.ios or second == PlatformTypes.ios:
-            return self.is_ios() == second.is_ios()
-
-        # Test MSDos
-        if self == PlatformTypes.msdos or second == PlatformTypes.msdos:
-            return self.is_msdos() == second.is_msdos()
-
-        # Test Android
-        if self == PlatformTypes.android or second == PlatformTypes.android:
-            return self.is_android() == second.is_android()
-        return False
+        # Use the group of whichever platform is a wildcard, like windows
+        group = _PLATFORMTYPES_WILDCARDS.get(self, None)
+        if group is None:
+            group = _PLATFORMTYPES_WILDCARDS.get(second, None)
+            if group is None:
+                return False
+        return (self in group) == (second in group)
 
     def get_vs_platform(self):
         """
@@ -1055,14 +1154,16 @@ class PlatformTypes(IntEnum):
             makeprojects.enums._PLATFORMTYPES_VS
         """
 
-        return _PLATFORMTYPES_VS.get(self, [])
+        return self._vs_platforms
 
     def get_expanded(self):
         """
-        Return a list of platforms from a platform that is a group.
+        Return the platforms in a platform that is a group.
+
+        Platforms that are not a group return a tuple with only themselves.
         """
 
-        return _PLATFORMTYPES_EXPANDED.get(self, [self])
+        return self._expanded
 
     def is_expandable(self):
         """
@@ -1095,57 +1196,39 @@ class PlatformTypes(IntEnum):
 
         # Already a PlatformTypes?
         if platform_name:
-            # Try the member name as is.
-            test_name = platform_name.lower()
-            if hasattr(PlatformTypes, test_name):
-                return PlatformTypes[test_name]
-
-            # Try a number of ways to find a match
-            for item in _PLATFORMTYPES_READABLE:
-                # Verbose name? File name short code?
-                if test_name == str(item).lower(
-                ) or test_name == _PLATFORMTYPES_CODES[item]:
-                    return item
-
-                # Visual studio target type?
-                if not item.is_expandable():
-                    for vs_name in _PLATFORMTYPES_VS.get(item, ()):
-                        if test_name == vs_name.lower():
-                            return item
-
-            specials = {
-                'macos': PlatformTypes.macos9,
-                'carbon': PlatformTypes.maccarbon
-            }
-            return specials.get(test_name, None)
+            # Member name? Verbose name? File name short code? Visual
+            # Studio target type?
+            return _PLATFORMTYPES_LOOKUP.get(platform_name.lower(), None)
         return None
 
     @staticmethod
     def default():
         """
         Determine the PlatformTypes from the currently running platform.
+
+        The host is only searched on the first call.
+        """
+
+        if 'platform_default' not in _HOST_SEARCHES:
+            _HOST_SEARCHES['platform_default'] = PlatformTypes._find_default()
+        return _HOST_SEARCHES['platform_default']
+
+    @staticmethod
+    def _find_default():
+        """
+        Search the host for the value returned by default().
         """
 
         # Windows host?
         temp = get_windows_host_type()
         if temp:
-            win_table = {
-                'x86': PlatformTypes.win32,
-                'x64': PlatformTypes.win64,
-                'arm': PlatformTypes.winarm32,
-                'arm64': PlatformTypes.winarm64,
-                'ia64': PlatformTypes.winitanium}
-            return win_table.get(temp, PlatformTypes.win32)
+            return _PLATFORMTYPES_WINDOWS_HOSTS.get(temp, PlatformTypes.win32)
 
         # Mac host?
         temp = get_mac_host_type()
         if temp:
-            mac_table = {
-                'ppc': PlatformTypes.macosxppc32,
-                'ppc64': PlatformTypes.macosxppc64,
-                'x32': PlatformTypes.macosxintel32,
-                'x64': PlatformTypes.macosxintel64}
-            return mac_table.get(temp, PlatformTypes.macosxintel64)
+            return _PLATFORMTYPES_MAC_HOSTS.get(
+                temp, PlatformTypes.macosxintel64)
 
         # Unknown platforms default to Linux
         return PlatformTypes.linux
@@ -1160,12 +1243,119 @@ class PlatformTypes(IntEnum):
             makeprojects.enums._PLATFORMTYPES_READABLE
         """
 
-        return _PLATFORMTYPES_READABLE.get(self, None)
+        return self._readable
 
     ## Allow str() to work.
     __str__ = __repr__
 
 
+## Microsoft Windows platforms
+_PLATFORMTYPES_WINDOWS = frozenset((
+    PlatformTypes.windows,
+    PlatformTypes.windowsintel,
+    PlatformTypes.windowsarm,
+    PlatformTypes.win32,
+    PlatformTypes.win64,
+    PlatformTypes.winarm32,
+    PlatformTypes.winarm64,
+    PlatformTypes.winitanium))
+
+## Microsoft Xbox platforms
+_PLATFORMTYPES_XBOX = frozenset((
+    PlatformTypes.xbox,
+    PlatformTypes.xbox360,
+    PlatformTypes.xboxone))
+
+## Apple macOS platforms
+_PLATFORMTYPES_MACOSX = frozenset((
+    PlatformTypes.macosx,
+    PlatformTypes.macosxppc32,
+    PlatformTypes.macosxppc64,
+    PlatformTypes.macosxintel32,
+    PlatformTypes.macosxintel64))
+
+## Apple iOS platforms
+_PLATFORMTYPES_IOS = frozenset((
+    PlatformTypes.ios,
+    PlatformTypes.ios32,
+    PlatformTypes.ios64,
+    PlatformTypes.iosemu,
+    PlatformTypes.iosemu32,
+    PlatformTypes.iosemu64))
+
+## Apple MacOS Carbon API platforms
+_PLATFORMTYPES_MACOS_CARBON = frozenset((
+    PlatformTypes.maccarbon,
+    PlatformTypes.maccarbon68k,
+    PlatformTypes.maccarbonppc))
+
+## Apple MacOS 1.0 through 9.2.2 platforms
+_PLATFORMTYPES_MACOS_CLASSIC = frozenset((
+    PlatformTypes.macos9,
+    PlatformTypes.macos968k,
+    PlatformTypes.macos9ppc))
+
+## MSDos platforms
+_PLATFORMTYPES_MSDOS = frozenset((
+    PlatformTypes.msdos,
+    PlatformTypes.msdos4gw,
+    PlatformTypes.msdosx32))
+
+## Android platforms
+_PLATFORMTYPES_ANDROID = frozenset((
+    PlatformTypes.android,
+    PlatformTypes.shield,
+    PlatformTypes.ouya,
+    PlatformTypes.amico,
+    PlatformTypes.tegra,
+    PlatformTypes.androidarm32,
+    PlatformTypes.androidarm64,
+    PlatformTypes.androidintel32,
+    PlatformTypes.androidintel64))
+
+## Nintendo Switch platforms
+_PLATFORMTYPES_SWITCH = frozenset((
+    PlatformTypes.switch,
+    PlatformTypes.switch32,
+    PlatformTypes.switch64))
+
+## Windows host CPU types from burger.get_windows_host_type()
+#
+# @sa makeprojects.enums.PlatformTypes.default
+
+_PLATFORMTYPES_WINDOWS_HOSTS = {
+    'x86': PlatformTypes.win32,
+    'x64': PlatformTypes.win64,
+    'arm': PlatformTypes.winarm32,
+    'arm64': PlatformTypes.winarm64,
+    'ia64': PlatformTypes.winitanium
+}
+
+## Mac host CPU types from burger.get_mac_host_type()
+#
+# @sa makeprojects.enums.PlatformTypes.default
+
+_PLATFORMTYPES_MAC_HOSTS = {
+    'ppc': PlatformTypes.macosxppc32,
+    'ppc64': PlatformTypes.macosxppc64,
+    'x32': PlatformTypes.macosxintel32,
+    'x64': PlatformTypes.macosxintel64
+}
+
+## Platforms that match every platform in a group
+#
+# @sa makeprojects.enums.PlatformTypes.match
+
+_PLATFORMTYPES_WILDCARDS = {
+    PlatformTypes.windows: _PLATFORMTYPES_WINDOWS,
+    PlatformTypes.macosx: _PLATFORMTYPES_MACOSX,
+    PlatformTypes.macos9: _PLATFORMTYPES_MACOS_CLASSIC,
+    PlatformTypes.maccarbon: _PLATFORMTYPES_MACOS_CARBON,
+    PlatformTypes.ios: _PLATFORMTYPES_IOS,
+    PlatformTypes.msdos: _PLATFORMTYPES_MSDOS,
+    PlatformTypes.android: _PLATFORMTYPES_ANDROID
+}
+
 ## List of platform short codes.
 #
 # Dictionary to map PlatformTypes enumerations into a
@@ -1232,6 +1422,9 @@ _PLATFORMTYPES_CODES = {
     PlatformTypes.iigs: '2gs'               # Apple IIgs
 }
 
+# Store the codes in the members for get_short_code()
+_set_member_attribute(PlatformTypes, '_short_code', _PLATFORMTYPES_CODES)
+
 ## List of Visual Studio platform codes
 #
 # Visual Studio uses specific codes for tool chains used for
@@ -1282,6 +1475,9 @@ _PLATFORMTYPES_VS = {
     PlatformTypes.androidintel64: ('x64-Android-NVIDIA',)
 }
 
+# Store the platforms in the members for get_vs_platform()
+_set_member_attribute(PlatformTypes, '_vs_platforms', _PLATFORMTYPES_VS, ())
+
 ## List of human readable strings
 #
 # Dictionary to map PlatformTypes enumerations into an human readable string
@@ -1368,6 +1564,10 @@ _PLATFORMTYPES_READABLE = {
     PlatformTypes.iigs: 'Apple IIgs'
 }
 
+# Store the strings in the members for __repr__()
+_set_member_attribute(
+    PlatformTypes, '_readable', _PLATFORMTYPES_READABLE)
+
 ## List of platforms that expand to multiple targets.
 #
 # Dictionary to map generic PlatformTypes enumerations into lists.
@@ -1423,6 +1623,25 @@ _PLATFORMTYPES_EXPANDED = {
     )
 }
 
+# Store the expanded platforms in the members for get_expanded()
+for _item in PlatformTypes:
+    _item._expanded = _PLATFORMTYPES_EXPANDED.get(_item, (_item,))
+del _item
+
+## Dictionary of lower case names to PlatformTypes
+#
+# @sa makeprojects.enums.PlatformTypes.lookup()
+
+_PLATFORMTYPES_LOOKUP = _create_lookup(
+    PlatformTypes,
+    ((item, (name, _PLATFORMTYPES_CODES[item]) + (
+        () if item.is_expandable() else _PLATFORMTYPES_VS.get(item, ())))
+     for item, name in _PLATFORMTYPES_READABLE.items()),
+    {
+        'macos': PlatformTypes.macos9,
+        'carbon': PlatformTypes.maccarbon
+    })
+
 
 ########################################
 
@@ -49,6 +49,72 @@ def test(ide, platform_type):
     return platform_type is PlatformTypes.linux
 
 
+## Commands to copy a library to the deploy folder, {0} is the folder
+_MAKE_LIBRARY_DEPLOY = (
+    '\t@if [ -f /bin/wslpath ]; then \\',
+    '\tp4.exe edit $$(wslpath -a -w \'{0}/$(@F)\'); \\',
+    '\tcp -T "$@" "{0}/$(@F)"; \\',
+    '\tp4.exe revert -a $$(wslpath -a -w \'{0}/$(@F)\'); \\',
+    '\telse \\',
+    '\tp4 edit "{0}/$(@F)"; \\',
+    '\tcp -T "$@" "{0}/$(@F)"; \\',
+    '\tp4 revert -a "{0}/$(@F)"; \\',
+    '\tfi'
+)
+
+## Commands to copy an executable to the deploy folder, {0} is the folder
+# and {1} is the name of the executable
+_MAKE_EXE_DEPLOY = (
+    '\t@-p4 edit "{0}/{1}',
+    '\t@-cp -T "$^@" "{0}/{1}',
+    '\t@-p4 revert -a "{0}/{1}'
+)
+
+## Rules that end every makefile
+_MAKE_TRAILER = (
+    '%.d: ;',
+    '',
+    '%: %,v',
+    '',
+    '%: RCS/%,v',
+    '',
+    '%: RCS/%',
+    '',
+    '%: s.%',
+    '',
+    '%: SCCS/s.%',
+    '',
+    '%.h: ;',
+    '',
+    '#',
+    '# Include the generated dependencies',
+    '#',
+    '',
+    '-include $(DEPS)'
+)
+
+########################################
+
+
+def _continued_list(variable, items):
+    """ Create the lines of a multi-line make variable.
+
+    The first line assigns the variable and every line but the last
+    ends with a line continuation.
+
+    Args:
+        variable: Name of the make variable
+        items: Non empty list of values, one per line
+    Returns:
+        list of text lines
+    """
+
+    lines = ['\t' + item + ' \\' for item in items]
+    lines[0] = variable + ':= ' + items[0] + ' \\'
+    lines[-1] = lines[-1][:-2]
+    return lines
+
+
 ########################################
 
 class Project(object):
@@ -91,8 +157,16 @@ class Project(object):
             # Create sets of configuration names and projects
             for configuration in project.configuration_list:
 
+                # Names used by several rules, computed only once
+                platform_short_code = configuration.platform.get_short_code()
                 configuration.make_name = configuration.name + \
-                    configuration.platform.get_short_code()
+                    platform_short_code
+                make_binary = solution.name + 'mak' + \
+                    platform_short_code[-3:] + configuration.short_code
+                configuration.make_temp = make_binary
+                if configuration.project_type is ProjectTypes.library:
+                    make_binary = 'lib' + make_binary + '.a'
+                configuration.make_binary = make_binary
 
                 # Add only if not already present
                 for item in self.configuration_names:
@@ -169,12 +243,11 @@ class Project(object):
                 '#'
             ])
 
+            short_codes = [item.get_short_code() for item in self.platforms]
             for configuration in self.configuration_names:
                 target_list = [configuration.name + ':']
-                for platform in self.platforms:
-                    target_list.append(
-                        configuration.name +
-                        platform.get_short_code())
+                for short_code in short_codes:
+                    target_list.append(configuration.name + short_code)
                 line_list.extend(['',
                                   '.PHONY: ' + configuration.name,
                                   ' '.join(target_list) + ' ;'
@@ -190,13 +263,12 @@ class Project(object):
             ])
 
             for platform in self.platforms:
-                target_list = [platform.get_short_code() + ':']
+                short_code = platform.get_short_code()
+                target_list = [short_code + ':']
                 for configuration in self.configuration_list:
-                    target_list.append(
-                        configuration.name +
-                        platform.get_short_code())
+                    target_list.append(configuration.name + short_code)
                 line_list.extend(['',
-                                  '.PHONY: ' + platform.get_short_code(),
+                                  '.PHONY: ' + short_code,
                                   ' '.join(target_list) + ' ;'])
 
         # Generate the list of final binaries
@@ -210,24 +282,16 @@ class Project(object):
             ])
 
             for configuration in self.configuration_list:
-                if configuration.project_type is ProjectTypes.library:
-                    template = 'lib{}.a'
-                else:
-                    template = '{}'
-
-                platform_short_code = configuration.platform.get_short_code()
-                target_name = configuration.name + platform_short_code
+                target_name = configuration.make_name
                 line_list.extend([
                     '',
                     '.PHONY: ' + target_name,
                     target_name + ':',
                     '\t@$(MAKE) -e --no-print-directory CONFIG=' +
                     configuration.name +
-                    ' TARGET=' + platform_short_code +
+                    ' TARGET=' + configuration.platform.get_short_code() +
                     ' -f ' + self.solution.makefile_filename +
-                    ' bin/' + template.format(self.solution.name + 'mak' +
-                                              platform_short_code[-3:] +
-                                              configuration.short_code)
+                    ' bin/' + configuration.make_binary
                 ])
 
         # Generate the "clean" target
@@ -243,25 +307,12 @@ class Project(object):
             ])
             remove_list = ['\t@-rm -rf']
             for configuration in self.configuration_list:
-                remove_list.append(
-                    'temp/' + self.solution.name + 'mak' +
-                    configuration.platform.get_short_code()[-3:] +
-                    configuration.short_code)
+                remove_list.append('temp/' + configuration.make_temp)
             line_list.append(' '.join(remove_list))
 
             remove_list = ['\t@-rm -f']
             for configuration in self.configuration_list:
-                if configuration.project_type is ProjectTypes.library:
-                    template = 'lib{}.a'
-                else:
-                    template = '{}'
-
-                remove_list.append(
-                    'bin/' +
-                    template.format(
-                        self.solution.name + 'mak' +
-                        configuration.platform.get_short_code()[-3:] +
-                        configuration.short_code))
+                remove_list.append('bin/' + configuration.make_binary)
             line_list.append(' '.join(remove_list))
 
             # Test if the directory is empty, if so, delete the directory
@@ -418,27 +469,30 @@ class Project(object):
 
         # Extract the directories from the files
         # Sort them for consistent diffs for source control
+        # The include folders keep their order, the set only tracks
+        # duplicates
         include_folders = []
-        source_folders = []
+        include_set = set()
+        source_folders = set()
         for configuration in self.configuration_list:
-            for item in configuration.get_unique_chained_list(
-                    '_source_include_list'):
-                if item not in source_folders:
-                    source_folders.append(item)
+            source_folders.update(configuration.get_unique_chained_list(
+                '_source_include_list'))
 
             for item in configuration.get_unique_chained_list(
                     'include_folders_list'):
-                if item not in include_folders:
+                if item not in include_set:
+                    include_set.add(item)
                     include_folders.append(item)
 
         if source_folders:
-            colon = ':='
-            for item in sorted(source_folders):
-                line_list.append(
-                    'SOURCE_DIRS ' +
-                    colon +
-                    encapsulate_path_linux(item))
-                colon = '+='
+            # The first folder assigns, the rest are appended, so there
+            # is no need to test a flag for every entry
+            source_folders = sorted(source_folders)
+            line_list.append(
+                'SOURCE_DIRS :=' + encapsulate_path_linux(source_folders[0]))
+            line_list.extend(
+                ['SOURCE_DIRS +=' + encapsulate_path_linux(item)
+                 for item in source_folders[1:]])
         else:
             line_list.append('SOURCE_DIRS :=')
 
@@ -590,35 +644,19 @@ class Project(object):
                     item.type is FileTypes.cpp or \
                     item.type is FileTypes.x86:
 
-                tempfile = convert_to_linux_slashes(
-                    item.relative_pathname)
-                index = tempfile.rfind('.')
-                if index == -1:
-                    entry = tempfile
-                else:
-                    entry = tempfile[:index]
-
-                index = entry.rfind('/')
-                if index != -1:
-                    entry = entry[index + 1:]
-
-                obj_list.append(entry)
+                # Strip the directory and the extension
+                obj_list.append(os.path.splitext(os.path.basename(
+                    convert_to_linux_slashes(item.relative_pathname)))[0])
 
         if obj_list:
-            colon = 'OBJS:= '
-            for item in sorted(obj_list):
-                line_list.append(colon + '$(TEMP_DIR)/' + item + '.o \\')
-                colon = '\t'
-            # Remove the ' &' from the last line
-            line_list[-1] = line_list[-1][:-2]
+            # Sort once, both lists use the same order
+            obj_list.sort()
+            line_list.extend(_continued_list(
+                'OBJS', ['$(TEMP_DIR)/' + item + '.o' for item in obj_list]))
 
             line_list.append('')
-            colon = 'DEPS:= '
-            for item in sorted(obj_list):
-                line_list.append(colon + '$(TEMP_DIR)/' + item + '.d \\')
-                colon = '\t'
-            # Remove the ' &' from the last line
-            line_list[-1] = line_list[-1][:-2]
+            line_list.extend(_continued_list(
+                'DEPS', ['$(TEMP_DIR)/' + item + '.d' for item in obj_list]))
 
         else:
             line_list.append('OBJS:=')
@@ -675,24 +713,18 @@ class Project(object):
                 '# Build the object files',
                 '#',
             ])
-            for item in source_list:
 
-                # Hack off the .cpp extension
-                index = item.rfind('.')
-                if index == -1:
-                    entry = item
-                else:
-                    entry = item[:index]
+            # One rule per file, each preceded by a blank line, appended
+            # directly instead of through a temporary list per file
+            append = line_list.append
+            for item in source_list:
 
-                # Hack off the directory prefix
-                index = entry.rfind('/')
-                if index != -1:
-                    entry = entry[index + 1:]
+                # Hack off the directory prefix and the .cpp extension
+                entry = os.path.splitext(os.path.basename(item))[0]
 
-                line_list.extend(
-                    ['',
-                     '$(TEMP_DIR)/{0}.o: {1} ; $(BUILD_CPP)'.format(entry, item)
-                     ])
+                append('')
+                append('$(TEMP_DIR)/{0}.o: {1} ; $(BUILD_CPP)'.format(
+                    entry, item))
         return 0
 
     def write_builds(self, line_list):
@@ -707,77 +739,33 @@ class Project(object):
             '#'
         ])
 
-        for configuration in self.configuration_list:
-            if configuration.project_type == ProjectTypes.library:
-                suffix = '.a'
-                prefix = 'lib'
-            else:
-                suffix = ''
-                prefix = ''
+        # Values that are the same for every rule
+        name = self.solution.name
+        makefile_filename = self.solution.makefile_filename
 
+        for configuration in self.configuration_list:
             line_list.append('')
-            line_list.append(
-                'bin/' + prefix + self.solution.name + 'mak' +
-                configuration.platform.get_short_code()[-3:] +
-                configuration.short_code +
-                suffix + ': $(OBJS) ' +
-                self.solution.makefile_filename + ' | bin')
+            line_list.append('bin/{}: $(OBJS) {} | bin'.format(
+                configuration.make_binary, makefile_filename))
+
             if configuration.project_type is ProjectTypes.library:
                 line_list.append('\t@ar -rcs $@ $(OBJS)')
-                if configuration.deploy_folder:
-                    deploy_folder = convert_to_linux_slashes(
-                        configuration.deploy_folder,
-                        force_ending_slash=True)[:-1]
-                    line_list.extend(
-                        [
-                            '\t@if [ -f /bin/wslpath ]; then \\',
-                            '\tp4.exe edit $$(wslpath -a -w \'{}/$(@F)\'); \\'.format(deploy_folder),
-                            '\tcp -T "$@" "{}/$(@F)"; \\'.format(deploy_folder),
-                            '\tp4.exe revert -a $$(wslpath -a -w \'{}/$(@F)\'); \\'.format(deploy_folder),
-                            '\telse \\',
-                            '\tp4 edit "{}/$(@F)"; \\'.format(deploy_folder),
-                            '\tcp -T "$@" "{}/$(@F)"; \\'.format(deploy_folder),
-                            '\tp4 revert -a "{}/$(@F)"; \\'.format(deploy_folder),
-                            '\tfi'])
+                templates = _MAKE_LIBRARY_DEPLOY
             else:
                 line_list.append(
                     '\t@$(LINK) -o $@ $(OBJS) '
                     '$(LFlags$(CONFIG)$(TARGET))')
-                if configuration.deploy_folder:
-                    deploy_folder = convert_to_linux_slashes(
-                        configuration.deploy_folder,
-                        force_ending_slash=True)[:-1]
-                    line_list.extend([
-                        '\t@-p4 edit "{}/{}'.format(
-                            deploy_folder, self.solution.name),
-                        '\t@-cp -T "$^@" "{}/{}'.format(
-                            deploy_folder, self.solution.name),
-                        '\t@-p4 revert -a "{}/{}'.format(
-                            deploy_folder, self.solution.name)
-                    ])
+                templates = _MAKE_EXE_DEPLOY
+
+            if configuration.deploy_folder:
+                deploy_folder = convert_to_linux_slashes(
+                    configuration.deploy_folder,
+                    force_ending_slash=True)[:-1]
+                line_list.extend(
+                    [item.format(deploy_folder, name) for item in templates])
 
         line_list.append('')
-        line_list.extend([
-            '%.d: ;',
-            '',
-            '%: %,v',
-            '',
-            '%: RCS/%,v',
-            '',
-            '%: RCS/%',
-            '',
-            '%: s.%',
-            '',
-            '%: SCCS/s.%',
-            '',
-            '%.h: ;',
-            '',
-            '#',
-            '# Include the generated dependencies',
-            '#',
-            '',
-            '-include $(DEPS)'
-        ])
+        line_list.extend(_MAKE_TRAILER)
         return 0
 
     ########################################
@@ -29,6 +29,40 @@ from .glsl_support import make_glsl_command
 
 SUPPORTED_IDES = (IDETypes.vs2003, IDETypes.vs2005, IDETypes.vs2008)
 
+## Element and attribute names are a small fixed set, escape each one once
+_ESCAPED_NAMES = {}
+
+## Visual Studio 2003 writes booleans in upper case
+_VS2003_BOOLEANS = {'true': 'TRUE', 'false': 'FALSE'}
+
+## Commands to copy a file, {0} is the source and {1} is the destination
+_COPY_FILE_COMMANDS = ('copy /Y "{0}" "{1}"',)
+
+## Copy a file with a Perforce check out first and a revert if unchanged.
+# Note, use ``cmd /c`` so if a Perforce call fails, the batch file will
+# continue
+_COPY_FILE_PERFORCE_COMMANDS = (
+    'cmd /c p4 edit "{1}"',
+    'copy /Y "{0}" "{1}"',
+    'cmd /c p4 revert -a "{1}"')
+
+########################################
+
+
+def _escape_name(name):
+    """ Escape an XML element or attribute name, with caching.
+
+    Args:
+        name: Name of the element or attribute
+    Returns:
+        Shared escaped copy of the name
+    """
+
+    result = _ESCAPED_NAMES.get(name)
+    if result is None:
+        result = _ESCAPED_NAMES.setdefault(name, escape_xml_cdata(name))
+    return result
+
 ########################################
 
 
@@ -1342,23 +1376,12 @@ def create_copy_file_script(source_file, dest_file, perforce):
         create_deploy_script
     """
 
-    command_list = []
-
-    # Check out the file
     if perforce:
-        # Note, use ``cmd /c``` so if the call fails, the batch file will
-        # continue
-        command_list.append('cmd /c p4 edit "{}"'.format(dest_file))
-
-    # Perform the copy
-    command_list.append(
-        ('copy /Y "{}" "{}"').format(source_file, dest_file))
-
-    # Revert the file if it hasn't changed
-    if perforce:
-        command_list.append('cmd /c p4 revert -a "{}"'.format(dest_file))
+        templates = _COPY_FILE_PERFORCE_COMMANDS
+    else:
+        templates = _COPY_FILE_COMMANDS
 
-    return command_list
+    return [item.format(source_file, dest_file) for item in templates]
 
 ########################################
 
@@ -1462,14 +1485,54 @@ def create_deploy_script(configuration):
 
 ########################################
 
+def build_file_tree(codefiles):
+    """
+    Sort a file list into groups and a directory tree.
+
+    Each file is placed into the group named by its directory and the
+    group names are then converted from a flat list into a hierarchical
+    tree suitable for do_tree().
+
+    Args:
+        codefiles: list of SourceFile entries.
+    Returns:
+        Tuple of the dict of group names to SourceFile lists, and the
+        dict tree of the group names.
+    See Also:
+        do_tree
+    """
+
+    # Create group names and attach all files that belong to that group
+    groups = dict()
+    for item in codefiles:
+        # Put each filename in its proper group, SourceFile already
+        # stores the name with Windows slashes
+        item.vs_name = item.relative_pathname
+        groups.setdefault(item.get_group_name(), []).append(item)
+
+    # Convert from a flat tree into a hierarchical tree
+    tree = dict()
+    for group in groups:
+
+        # Step into the tree, declaring each part if needed
+        nexttree = tree
+        for part in group.split('\\'):
+            nexttree = nexttree.setdefault(part, {})
+    return groups, tree
+
+########################################
+
+
 def do_tree(xml_entry, filter_name, tree, groups):
     """
-    Recursively create a Filter/File tree.
+    Create a Filter/File tree.
 
-    Dump out a recursive tree of files to reconstruct a
+    Dump out a tree of files to reconstruct a
     directory hiearchy for a file list with XML Filter
     records.
 
+    The tree is walked with a work list instead of recursion.
+
     Args:
         xml_entry: Root entry to attach records to.
         filter_name: Name of the current filter
@@ -1477,30 +1540,37 @@ def do_tree(xml_entry, filter_name, tree, groups):
         groups: List of filter entries to match to the tree
     """
 
-    # Process the tree in sorted order for consistency
-    for item in sorted(tree):
-        # Root entry has no slash.
-        if filter_name == '':
-            merged = item
-        else:
-            merged = filter_name + '\\' + item
+    project = xml_entry.project
+    vs_name_key = operator.attrgetter('vs_name')
 
-        # Create the filter entry
-        new_filter = VS2003Filter(item, xml_entry.project)
-        xml_entry.add_element(new_filter)
+    # Each entry is the parent record, its filter name and its tree
+    work_list = [(xml_entry, filter_name, tree)]
+    while work_list:
+        xml_entry, filter_name, tree = work_list.pop()
 
-        # See if this directory string creates a group?
-        if merged in groups:
-            # Found, add all the elements into this filter
-            for fileitem in sorted(
-                    groups[merged],
-                    key=operator.attrgetter('vs_name')):
-                new_filter.add_element(VS2003File(fileitem, xml_entry.project))
+        # Process the tree in sorted order for consistency
+        for item in sorted(tree):
+            # Root entry has no slash.
+            if filter_name == '':
+                merged = item
+            else:
+                merged = '{}\\{}'.format(filter_name, item)
+
+            # Create the filter entry
+            new_filter = VS2003Filter(item, project)
+            xml_entry.add_element(new_filter)
 
-        tree_key = tree[item]
-        # Recurse down the tree if there are sub entries
-        if isinstance(tree_key, dict):
-            do_tree(new_filter, merged, tree_key, groups)
+            # See if this directory string creates a group?
+            if merged in groups:
+                # Found, add all the elements into this filter
+                for fileitem in sorted(groups[merged], key=vs_name_key):
+                    new_filter.add_element(VS2003File(fileitem, project))
+
+            # Sub entries are added to new_filter after its files, the
+            # same order the recursive version used
+            tree_key = tree[item]
+            if isinstance(tree_key, dict):
+                work_list.append((new_filter, merged, tree_key))
 
 ########################################
 
@@ -1930,57 +2000,59 @@ class VS2003XML():
         # vs2003 uses tabs
         tabs = '\t' * indent
 
+        # The lines are joined and written in a single call by the caller,
+        # so just bind the append method for the many calls below
+        append = line_list.append
+        name = _escape_name(self.name)
+
         # Special case, if no attributes, don't allow <foo/> XML
         # This is to duplicate the output of Visual Studio 2005-2008
-        line_list.append('{0}<{1}'.format(tabs, escape_xml_cdata(self.name)))
+        append('{0}<{1}'.format(tabs, name))
 
+        # Format each attribute line as it's found
+        is_vs2003 = ide is IDETypes.vs2003
         attributes = []
         for item in self.attributes:
             value = item.get_value()
             if value is not None:
-                attributes.append((item.name, value))
-
-        if attributes:
-
-            # Output tag with attributes and support '/>' closing
-            for attribute in attributes:
-                value = attribute[1]
 
                 # VS2003 has upper case booleans
-                if ide is IDETypes.vs2003:
-                    if value == 'true':
-                        value = 'TRUE'
-                    elif value == 'false':
-                        value = 'FALSE'
+                if is_vs2003:
+                    value = _VS2003_BOOLEANS.get(value, value)
 
-                line_list.append(
+                attributes.append(
                     '{0}\t{1}="{2}"'.format(
                         tabs,
-                        escape_xml_cdata(attribute[0]),
+                        _escape_name(item.name),
                         escape_xml_attribute(value)))
 
+        if attributes:
+
+            # Output tag with attributes and support '/>' closing
+            line_list.extend(attributes)
+
             # Check if /> closing is disabled
             if not self.elements and not self.force_pair:
-                if ide is IDETypes.vs2003:
-                    line_list[-1] = line_list[-1] + '/>'
+                if is_vs2003:
+                    line_list[-1] += '/>'
                 else:
-                    line_list.append('{}/>'.format(tabs))
+                    append('{}/>'.format(tabs))
                 return line_list
 
             # Close the open tag
-            if ide is IDETypes.vs2003:
-                line_list[-1] = line_list[-1] + '>'
+            if is_vs2003:
+                line_list[-1] += '>'
             else:
-                line_list.append('{}\t>'.format(tabs))
+                append('{}\t>'.format(tabs))
         else:
-            line_list[-1] = line_list[-1] + '>'
+            line_list[-1] += '>'
 
         # Output the embedded elements
         for element in self.elements:
             element.generate(line_list, indent=indent + 1, ide=ide)
 
         # Close the current element
-        line_list.append('{0}</{1}>'.format(tabs, escape_xml_cdata(self.name)))
+        append('{0}</{1}>'.format(tabs, name))
         return line_list
 
     def __repr__(self):
@@ -3760,10 +3832,8 @@ class VS2003FileConfiguration(VS2003XML):
         if not tool_name:
             return
 
-        rule_list = (
-            configuration.custom_rules,
-            configuration.parent.custom_rules,
-            configuration.parent.parent.custom_rules)
+        # Built once per configuration by generate()
+        rule_list = configuration.vs_rule_list
 
         if configuration.ide is IDETypes.vs2003 \
                 and tool_name != 'VCCLCompilerTool':
@@ -3923,37 +3993,10 @@ class VS2003Files(VS2003XML):
         self.project = project
         VS2003XML.__init__(self, 'Files')
 
-        # Create group names and attach all files that belong to that group
-        groups = dict()
-        for item in project.codefiles:
-            groupname = item.get_group_name()
-
-            # Put each filename in its proper group
-            item.vs_name = convert_to_windows_slashes(item.relative_pathname)
-            group = groups.get(groupname, None)
-            if group is None:
-                groups[groupname] = [item]
-            else:
-                group.append(item)
-
-        # Convert from a flat tree into a hierarchical tree
-        tree = dict()
-        for group in groups:
-
-            # Get the depth of the tree needed
-            parts = group.split('\\')
-            nexttree = tree
-
-            # Iterate over every part
-            for item, _ in enumerate(parts):
-                # Already declared?
-                if not parts[item] in nexttree:
-                    nexttree[parts[item]] = dict()
-                # Step into the tree
-                nexttree = nexttree[parts[item]]
-
-        # Generate the file tree
-        do_tree(self, '', tree, groups)
+        # Generate the file tree, if there are any files
+        if project.codefiles:
+            groups, tree = build_file_tree(project.codefiles)
+            do_tree(self, '', tree, groups)
 
 ########################################
 
@@ -3994,7 +4037,7 @@ class VS2003vcproj(VS2003XML):
              StringProperty('Version', version),
              StringProperty('Name', name),
              StringProperty('ProjectGUID',
-                            '{' + project.vs_uuid + '}')])
+                            '{{{}}}'.format(project.vs_uuid))])
 
         self.add_default(
             StringProperty('RootNamespace', name))
@@ -4097,6 +4140,13 @@ def generate(solution):
             configuration.vs_configuration_name = '{}|{}'.format(
                 configuration.name, vs_platform)
 
+            # Custom rules are tested for every file, so gather the
+            # configuration, project and solution rules only once
+            configuration.vs_rule_list = (
+                configuration.custom_rules,
+                configuration.parent.custom_rules,
+                configuration.parent.parent.custom_rules)
+
     # Write to memory for file comparison
     error, solution_lines = generate_solution_file(solution)
     if error:
@@ -1362,25 +1362,22 @@ class VS2010Files(VS2010XML):
             self.add_element(
                 VS2010XML(
                     'ClInclude', {
-                        'Include': convert_to_windows_slashes(
-                            item.relative_pathname)}))
+                        'Include': item.relative_pathname}))
 
         for item in source_file_filter(project.codefiles, FileTypes.cpp):
             self.add_element(
                 VS2010XML(
                     'ClCompile', {
-                        'Include': convert_to_windows_slashes(
-                            item.relative_pathname)}))
+                        'Include': item.relative_pathname}))
 
         for item in source_file_filter(project.codefiles, FileTypes.rc):
             self.add_element(
                 VS2010XML(
                     'ResourceCompile', {
-                        'Include': convert_to_windows_slashes(
-                            item.relative_pathname)}))
+                        'Include': item.relative_pathname}))
 
         for item in source_file_filter(project.codefiles, FileTypes.hlsl):
-            name = convert_to_windows_slashes(item.relative_pathname)
+            name = item.relative_pathname
             element = VS2010XML('HLSL', {'Include': name})
             self.add_element(element)
 
@@ -1426,7 +1423,7 @@ class VS2010Files(VS2010XML):
                  '%(RootDir)%(Directory)Generated\\%(FileName).h')))
 
         for item in source_file_filter(project.codefiles, FileTypes.x360sl):
-            name = convert_to_windows_slashes(item.relative_pathname)
+            name = item.relative_pathname
             element = VS2010XML('X360SL', {'Include': name})
             self.add_element(element)
 
@@ -1460,7 +1457,7 @@ class VS2010Files(VS2010XML):
                  '%(RootDir)%(Directory)Generated\\%(FileName).h')))
 
         for item in source_file_filter(project.codefiles, FileTypes.vitacg):
-            name = convert_to_windows_slashes(item.relative_pathname)
+            name = item.relative_pathname
             element = VS2010XML('VitaCGCompile', {'Include': name})
             self.add_element(element)
 
@@ -1479,8 +1476,7 @@ class VS2010Files(VS2010XML):
                     contents='%(RootDir)%(Directory)Generated\\%(FileName).h'))
 
         for item in source_file_filter(project.codefiles, FileTypes.glsl):
-            element = VS2010XML('GLSL', {'Include': convert_to_windows_slashes(
-                item.relative_pathname)})
+            element = VS2010XML('GLSL', {'Include': item.relative_pathname})
             self.add_element(element)
             element.add_tags(
                 (('ObjectFileName',
@@ -1494,8 +1490,7 @@ class VS2010Files(VS2010XML):
             self.add_element(
                 VS2010XML(
                     chunkname, {
-                        'Include': convert_to_windows_slashes(
-                            item.relative_pathname)}))
+                        'Include': item.relative_pathname}))
 
 ########################################
 
@@ -1667,7 +1662,6 @@ class VS2010vcprojfilter(VS2010XML):
 
         # Output the group list
         for item in groupset:
-            item = convert_to_windows_slashes(item)
             groupuuid = get_uuid(
                 project.vs_output_filename + item)
             filterxml = VS2010XML('Filter', {'Include': item})
@@ -1696,8 +1690,7 @@ class VS2010vcprojfilter(VS2010XML):
                 # Write out the record
                 element = VS2010XML(
                     compilername, {
-                        'Include': convert_to_windows_slashes(
-                            item.relative_pathname)})
+                        'Include': item.relative_pathname})
                 self.main_element.add_element(element)
                 element.add_element(VS2010XML('Filter', contents=groupname))
 
@@ -31,6 +31,224 @@ from .enums import FileTypes, ProjectTypes, PlatformTypes, IDETypes
 
 SUPPORTED_IDES = (IDETypes.watcom,)
 
+## Source file types that are compiled into object files
+_WMK_OBJECT_TYPES = frozenset((FileTypes.c, FileTypes.cpp, FileTypes.x86))
+
+## Boilerplate that follows the title of every WMAKE file
+_WMK_HEADER = (
+    '# Generated with makeprojects',
+    '#',
+    '# Require the environment variable WATCOM set to the OpenWatcom '
+    'folder',
+    '# Example: WATCOM=C:\\WATCOM',
+    '#',
+    '',
+    '# This speeds up the building process for Watcom because it',
+    '# keeps the apps in memory and doesn\'t have '
+    'to reload for every source file',
+    '# Note: There is a bug that if the wlib app is loaded, '
+    'it will not',
+    '# get the proper WOW file if a full build is performed',
+    '',
+    '# The bug is gone from Watcom 1.2',
+    '',
+    '!ifdef %WATCOM',
+    '!ifdef __LOADDLL__',
+    '!loaddll wcc $(%WATCOM)/binnt/wccd',
+    '!loaddll wccaxp $(%WATCOM)/binnt/wccdaxp',
+    '!loaddll wcc386 $(%WATCOM)/binnt/wccd386',
+    '!loaddll wpp $(%WATCOM)/binnt/wppdi86',
+    '!loaddll wppaxp $(%WATCOM)/binnt/wppdaxp',
+    '!loaddll wpp386 $(%WATCOM)/binnt/wppd386',
+    '!loaddll wlink $(%WATCOM)/binnt/wlinkd',
+    '!loaddll wlib $(%WATCOM)/binnt/wlibd',
+    '!endif',
+    '!endif'
+)
+
+## File extensions known to WMAKE
+_WMK_EXTENSIONS = (
+    '',
+    '#',
+    '# Set the set of known files supported',
+    '# Note: They are in the reverse order of building. .c is '
+    'built first, then .x86',
+    '# until the .exe or .lib files are built',
+    '#',
+    '',
+    '.extensions:',
+    '.extensions: .exe .exp .lib .obj .h .cpp .x86 .c .i86'
+)
+
+## SDK location and the start of the source folder list
+_WMK_SOURCE_DIRS = (
+    '',
+    '#',
+    '# Ensure sdks are pulled from the environment',
+    '#',
+    '',
+    'BURGER_SDKS = $(%BURGER_SDKS)',
+    # Set the folders for the source code to search
+    '',
+    '#',
+    '# SOURCE_DIRS = Work directories for the source code',
+    '#',
+    ''
+)
+
+## Temp, binary and include directories
+_WMK_DIRECTORIES = (
+    '',
+    '#',
+    '# Base name of the temp directory',
+    '#',
+    '',
+    'BASE_TEMP_DIR = temp/$(PROJECT_NAME)',
+    'BASE_SUFFIX = wat$(TARGET_SUFFIX_$(%TARGET))'
+    '$(CONFIG_SUFFIX_$(%CONFIG))',
+    'TEMP_DIR = $(BASE_TEMP_DIR)$(BASE_SUFFIX)',
+    # Save the final binary output directory
+    '',
+    '#',
+    '# Binary directory',
+    '#',
+    '',
+    'DESTINATION_DIR = bin',
+    # Extra include folders
+    '',
+    '#',
+    '# INCLUDE_DIRS = Header includes',
+    '#',
+    '',
+    'INCLUDE_DIRS = $(SOURCE_DIRS)'
+)
+
+## Compiler flags and default build rules
+_WMK_RULES = (
+    # Set the search directories for source files
+    '',
+    '#',
+    '# Tell WMAKE where to find the files to work with',
+    '#',
+    '',
+    '.c: $(SOURCE_DIRS)',
+    '.cpp: $(SOURCE_DIRS)',
+    '.x86: $(SOURCE_DIRS)',
+    '.i86: $(SOURCE_DIRS)',
+    # Global compiler flags
+    '',
+    '#',
+    '# Set the compiler flags for each of the build types',
+    '#',
+    '',
+    'CFlagsDebug=-d_DEBUG -d2 -od',
+    'CFlagsInternal=-d_DEBUG -d2 -oaxsh',
+    'CFlagsRelease=-dNDEBUG -d0 -oaxsh',
+    '',
+    '#',
+    '# Set the flags for each target operating system',
+    '#',
+    '',
+    'CFlagscom=-bt=com -d__COM__=1 -i="$(%BURGER_SDKS)/dos/burgerlib;'
+    '$(%BURGER_SDKS)/dos/x32;$(%WATCOM)/h"',
+    'CFlagsdosx32=-bt=DOS -d__X32__=1 '
+    '-i="$(%BURGER_SDKS)/dos/burgerlib;'
+    '$(%BURGER_SDKS)/dos/x32;$(%WATCOM)/h"',
+    'CFlagsdos4gw=-bt=DOS -d__DOS4G__=1 '
+    '-i="$(%BURGER_SDKS)/dos/burgerlib;'
+    '$(%BURGER_SDKS)/dos/sosaudio;$(%WATCOM)/h;$(%WATCOM)/h/nt"',
+    'CFlagsw32=-bt=NT -dGLUT_DISABLE_ATEXIT_HACK -dGLUT_NO_LIB_PRAGMA '
+    '-dTARGET_CPU_X86=1 -dTARGET_OS_WIN32=1 -dTYPE_BOOL=1 -dUNICODE '
+    '-d_UNICODE -dWIN32_LEAN_AND_MEAN '
+    '-i="$(%BURGER_SDKS)/windows/burgerlib;'
+    '$(%BURGER_SDKS)/windows/opengl;$(%BURGER_SDKS)/windows/directx9;'
+    '$(%BURGER_SDKS)/windows/windows5;'
+    '$(%BURGER_SDKS)/windows/quicktime7;'
+    '$(%WATCOM)/h;$(%WATCOM)/h/nt"',
+    '',
+    '#',
+    '# Set the WASM flags for each of the build types',
+    '#',
+    '',
+    'AFlagsDebug=-d_DEBUG',
+    'AFlagsInternal=-d_DEBUG',
+    'AFlagsRelease=-dNDEBUG',
+    '',
+    '#',
+    '# Set the WASM flags for each operating system',
+    '#',
+    '',
+    'AFlagscom=-d__COM__=1',
+    'AFlagsdosx32=-d__X32__=1',
+    'AFlagsdos4gw=-d__DOS4G__=1',
+    'AFlagsw32=-d__WIN32__=1',
+    '',
+    'LFlagsDebug=',
+    'LFlagsInternal=',
+    'LFlagsRelease=',
+    '',
+    'LFlagscom=format dos com libp $(%BURGER_SDKS)/dos/burgerlib',
+    'LFlagsx32=system x32r libp $(%BURGER_SDKS)/dos/burgerlib;'
+    '$(%BURGER_SDKS)/dos/x32',
+    'LFlagsdos4gw=system dos4g libp $(%BURGER_SDKS)/dos/burgerlib;'
+    '$(%BURGER_SDKS)/dos/sosaudio',
+    'LFlagsw32=system nt libp $(%BURGER_SDKS)/windows/burgerlib;'
+    '$(%BURGER_SDKS)/windows/directx9 LIBRARY VERSION.lib,opengl32.lib,'
+    'winmm.lib,shell32.lib,shfolder.lib',
+    '',
+    '# Now, set the compiler flags',
+    '',
+    'CL=WCC386 -6r -fp6 -w4 -ei -j -mf -zq -zp=8 '
+    '-wcd=7 -i=$(INCLUDE_DIRS)',
+    'CP=WPP386 -6r -fp6 -w4 -ei -j -mf -zq -zp=8 '
+    '-wcd=7 -i=$(INCLUDE_DIRS)',
+    'ASM=WASM -5r -fp6 -w4 -zq -d__WATCOM__=1',
+    'LINK=*WLINK option caseexact option quiet PATH $(%WATCOM)/binnt;'
+    '$(%WATCOM)/binw;.',
+    '',
+    '# Set the default build rules',
+    '# Requires ASM, CP to be set',
+    '',
+    '# Macro expansion is on page 93 of the C//C++ Tools User\'s Guide',
+    '# $^* = C:\\dir\\target (No extension)',
+    '# $[* = C:\\dir\\dep (No extension)',
+    '# $^@ = C:\\dir\\target.ext',
+    '# $^: = C:\\dir\\',
+    '',
+    '.i86.obj : .AUTODEPEND',
+    '\t@echo $[&.i86 / $(%CONFIG) / $(%TARGET)',
+    '\t@$(ASM) -0 -w4 -zq -d__WATCOM__=1 $(AFlags$(%CONFIG)) '
+    '$(AFlags$(%TARGET)) $[*.i86 -fo=$^@ -fr=$^*.err',
+    '',
+    '.x86.obj : .AUTODEPEND',
+    '\t@echo $[&.x86 / $(%CONFIG) / $(%TARGET)',
+    '\t@$(ASM) $(AFlags$(%CONFIG)) $(AFlags$(%TARGET)) '
+    '$[*.x86 -fo=$^@ -fr=$^*.err',
+    '',
+    '.c.obj : .AUTODEPEND',
+    '\t@echo $[&.c / $(%CONFIG) / $(%TARGET)',
+    '\t@$(CP) $(CFlags$(%CONFIG)) $(CFlags$(%TARGET)) $[*.c '
+    '-fo=$^@ -fr=$^*.err',
+    '',
+    '.cpp.obj : .AUTODEPEND',
+    '\t@echo $[&.cpp / $(%CONFIG) / $(%TARGET)',
+    '\t@$(CP) $(CFlags$(%CONFIG)) $(CFlags$(%TARGET)) $[*.cpp '
+    '-fo=$^@ -fr=$^*.err'
+)
+
+## Commands to create a library
+_WMK_LIBRARY_BUILD = (
+    '\t@SET WOW=$+$(OBJS)$-',
+    '\t@WLIB -q -b -c -n $^@ @WOW'
+)
+
+## Commands to link an executable
+_WMK_EXE_BUILD = (
+    '\t@SET WOW={$+$(OBJS)$-}',
+    '\t@$(LINK) $(LFlags$(%TARGET)) $(LFlags$(%CONFIG)) '
+    'LIBRARY burger$(BASE_SUFFIX).lib NAME $^@ FILE @wow'
+)
+
 ########################################
 
 
@@ -81,6 +299,19 @@ class Project(object):
         ## List of configuration names
         self.configuration_names = []
 
+        ## Configuration names found for each platform
+        self.platform_configurations = {}
+
+        ## Short code for each platform, used by most of the rules
+        self.platform_codes = {}
+
+        ## Three letter directory suffix for each platform
+        self.platform_suffixes = {}
+
+        # Names and configuration/platform pairs already added
+        seen_names = set()
+        seen_targets = set()
+
         # Process all the projects and configurations
         for project in solution.project_list:
 
@@ -96,17 +327,36 @@ class Project(object):
 
             # Create sets of configuration names and projects
             for configuration in project.configuration_list:
+                platform = configuration.platform
 
                 # Add only if not already present
-                for item in self.configuration_names:
-                    if configuration.name == item.name:
-                        break
-                else:
+                if configuration.name not in seen_names:
+                    seen_names.add(configuration.name)
                     self.configuration_names.append(configuration)
 
                 # Add platform if not already found
-                if configuration.platform not in self.platforms:
-                    self.platforms.append(configuration.platform)
+                if platform not in self.platform_codes:
+                    self.platforms.append(platform)
+                    self.platform_configurations[platform] = []
+                    code = platform.get_short_code()
+                    self.platform_codes[platform] = code
+                    self.platform_suffixes[platform] = code[-3:]
+
+                # Add the configuration name to its platform's list
+                target = (configuration.name, platform)
+                if target not in seen_targets:
+                    seen_targets.add(target)
+                    self.platform_configurations[platform].append(
+                        configuration.name)
+
+                # Names used by several rules, computed only once
+                watcom_name = 'wat' + self.platform_suffixes[platform] + \
+                    configuration.short_code
+                configuration.watcom_name = watcom_name
+                if configuration.project_type is ProjectTypes.library:
+                    configuration.watcom_binary = watcom_name + '.lib'
+                else:
+                    configuration.watcom_binary = watcom_name + '.exe'
 
     ########################################
 
@@ -117,35 +367,8 @@ class Project(object):
 
         line_list.extend([
             '#',
-            '# Build ' + self.solution.name + ' with WMAKE',
-            '# Generated with makeprojects',
-            '#',
-            '# Require the environment variable WATCOM set to the OpenWatcom '
-            'folder',
-            '# Example: WATCOM=C:\\WATCOM',
-            '#',
-            '',
-            '# This speeds up the building process for Watcom because it',
-            '# keeps the apps in memory and doesn\'t have '
-            'to reload for every source file',
-            '# Note: There is a bug that if the wlib app is loaded, '
-            'it will not',
-            '# get the proper WOW file if a full build is performed',
-            '',
-            '# The bug is gone from Watcom 1.2',
-            '',
-            '!ifdef %WATCOM',
-            '!ifdef __LOADDLL__',
-            '!loaddll wcc $(%WATCOM)/binnt/wccd',
-            '!loaddll wccaxp $(%WATCOM)/binnt/wccdaxp',
-            '!loaddll wcc386 $(%WATCOM)/binnt/wccd386',
-            '!loaddll wpp $(%WATCOM)/binnt/wppdi86',
-            '!loaddll wppaxp $(%WATCOM)/binnt/wppdaxp',
-            '!loaddll wpp386 $(%WATCOM)/binnt/wppd386',
-            '!loaddll wlink $(%WATCOM)/binnt/wlinkd',
-            '!loaddll wlib $(%WATCOM)/binnt/wlibd',
-            '!endif',
-            '!endif'])
+            '# Build ' + self.solution.name + ' with WMAKE'])
+        line_list.extend(_WMK_HEADER)
 
         # Default configuration
         config = None
@@ -172,10 +395,8 @@ class Project(object):
         target = None
         # Get all the configuration names
         for platform in self.platforms:
-            if platform is PlatformTypes.msdos4gw:
-                target = platform.get_short_code()
-            elif target is None:
-                target = platform.get_short_code()
+            if platform is PlatformTypes.msdos4gw or target is None:
+                target = self.platform_codes[platform]
         if target is None:
             target = 'Release'
 
@@ -198,29 +419,18 @@ class Project(object):
             ''
         ])
 
-        for platform in self.platforms:
-            line_list.append(
-                'TARGET_SUFFIX_{0} = {1}'.format(
-                    platform.get_short_code(),
-                    platform.get_short_code()[-3:]))
+        line_list.extend(
+            'TARGET_SUFFIX_{0} = {1}'.format(
+                self.platform_codes[platform],
+                self.platform_suffixes[platform])
+            for platform in self.platforms)
 
         line_list.append('')
-        for item in self.configuration_names:
-            line_list.append('CONFIG_SUFFIX_{0} = {1}'.format(item.name,
-                                                              item.short_code))
+        line_list.extend(
+            'CONFIG_SUFFIX_{0} = {1}'.format(item.name, item.short_code)
+            for item in self.configuration_names)
 
-        line_list.extend([
-            '',
-            '#',
-            '# Set the set of known files supported',
-            '# Note: They are in the reverse order of building. .c is '
-            'built first, then .x86',
-            '# until the .exe or .lib files are built',
-            '#',
-            '',
-            '.extensions:',
-            '.extensions: .exe .exp .lib .obj .h .cpp .x86 .c .i86',
-        ])
+        line_list.extend(_WMK_EXTENSIONS)
         return 0
 
     def write_source_dir(self, line_list):
@@ -228,47 +438,36 @@ class Project(object):
         Write out the list of directories for the source
         """
 
-        # Save the refernence BURGER_SDKS
-        line_list.extend([
-            '',
-            '#',
-            '# Ensure sdks are pulled from the environment',
-            '#',
-            '',
-            'BURGER_SDKS = $(%BURGER_SDKS)'
-        ])
-
-        # Set the folders for the source code to search
-        line_list.extend([
-            '',
-            '#',
-            '# SOURCE_DIRS = Work directories for the source code',
-            '#',
-            ''
-        ])
+        # Save the reference BURGER_SDKS and set the folders for the
+        # source code to search
+        line_list.extend(_WMK_SOURCE_DIRS)
 
         # Extract the directories from the files
         # Sort them for consistent diffs for source control
+        # Include folders are searched in the order found, so keep the
+        # first occurrence of each folder in place
         include_folders = []
         source_folders = []
+        include_seen = set()
+        source_seen = set()
         for configuration in self.configuration_list:
-            for item in configuration.get_unique_chained_list(
+            for item in configuration.get_chained_list(
                     '_source_include_list'):
-                if item not in source_folders:
+                if item not in source_seen:
+                    source_seen.add(item)
                     source_folders.append(item)
 
-            for item in configuration.get_unique_chained_list(
+            for item in configuration.get_chained_list(
                     'include_folders_list'):
-                if item not in include_folders:
+                if item not in include_seen:
+                    include_seen.add(item)
                     include_folders.append(item)
 
         if source_folders:
             colon = '='
+            append = line_list.append
             for item in sorted(source_folders):
-                line_list.append(
-                    'SOURCE_DIRS ' +
-                    colon +
-                    encapsulate_path_linux(item))
+                append('SOURCE_DIRS ' + colon + encapsulate_path_linux(item))
                 colon = '+=;'
         else:
             line_list.append('SOURCE_DIRS =')
@@ -282,43 +481,12 @@ class Project(object):
             '',
             'PROJECT_NAME = ' + self.solution.name])
 
-        # Save the base name of the temp directory
-        line_list.extend([
-            '',
-            '#',
-            '# Base name of the temp directory',
-            '#',
-            '',
-            'BASE_TEMP_DIR = temp/$(PROJECT_NAME)',
-            'BASE_SUFFIX = wat$(TARGET_SUFFIX_$(%TARGET))'
-            '$(CONFIG_SUFFIX_$(%CONFIG))',
-            'TEMP_DIR = $(BASE_TEMP_DIR)$(BASE_SUFFIX)'
-        ])
-
-        # Save the final binary output directory
-        line_list.extend([
-            '',
-            '#',
-            '# Binary directory',
-            '#',
-            '',
-            'DESTINATION_DIR = bin'
-        ])
-
-        # Extra include folders
-        line_list.extend([
-            '',
-            '#',
-            '# INCLUDE_DIRS = Header includes',
-            '#',
-            '',
-            'INCLUDE_DIRS = $(SOURCE_DIRS)'
-        ])
+        # Save the temp, binary and include directories
+        line_list.extend(_WMK_DIRECTORIES)
 
-        for item in include_folders:
-            line_list.append(
-                'INCLUDE_DIRS +=;' +
-                convert_to_linux_slashes(item))
+        line_list.extend(
+            'INCLUDE_DIRS +=;' + convert_to_linux_slashes(item)
+            for item in include_folders)
 
         return 0
 
@@ -327,120 +495,7 @@ class Project(object):
         Output the default rules for building object code
         """
 
-        # Set the search directories for source files
-        line_list.extend([
-            '',
-            '#',
-            '# Tell WMAKE where to find the files to work with',
-            '#',
-            '',
-            '.c: $(SOURCE_DIRS)',
-            '.cpp: $(SOURCE_DIRS)',
-            '.x86: $(SOURCE_DIRS)',
-            '.i86: $(SOURCE_DIRS)'
-        ])
-
-        # Global compiler flags
-        line_list.extend([
-            '',
-            '#',
-            '# Set the compiler flags for each of the build types',
-            '#',
-            '',
-            'CFlagsDebug=-d_DEBUG -d2 -od',
-            'CFlagsInternal=-d_DEBUG -d2 -oaxsh',
-            'CFlagsRelease=-dNDEBUG -d0 -oaxsh',
-            '',
-            '#',
-            '# Set the flags for each target operating system',
-            '#',
-            '',
-            'CFlagscom=-bt=com -d__COM__=1 -i="$(%BURGER_SDKS)/dos/burgerlib;'
-            '$(%BURGER_SDKS)/dos/x32;$(%WATCOM)/h"',
-            'CFlagsdosx32=-bt=DOS -d__X32__=1 '
-            '-i="$(%BURGER_SDKS)/dos/burgerlib;'
-            '$(%BURGER_SDKS)/dos/x32;$(%WATCOM)/h"',
-            'CFlagsdos4gw=-bt=DOS -d__DOS4G__=1 '
-            '-i="$(%BURGER_SDKS)/dos/burgerlib;'
-            '$(%BURGER_SDKS)/dos/sosaudio;$(%WATCOM)/h;$(%WATCOM)/h/nt"',
-            'CFlagsw32=-bt=NT -dGLUT_DISABLE_ATEXIT_HACK -dGLUT_NO_LIB_PRAGMA '
-            '-dTARGET_CPU_X86=1 -dTARGET_OS_WIN32=1 -dTYPE_BOOL=1 -dUNICODE '
-            '-d_UNICODE -dWIN32_LEAN_AND_MEAN '
-            '-i="$(%BURGER_SDKS)/windows/burgerlib;'
-            '$(%BURGER_SDKS)/windows/opengl;$(%BURGER_SDKS)/windows/directx9;'
-            '$(%BURGER_SDKS)/windows/windows5;'
-            '$(%BURGER_SDKS)/windows/quicktime7;'
-            '$(%WATCOM)/h;$(%WATCOM)/h/nt"',
-            '',
-            '#',
-            '# Set the WASM flags for each of the build types',
-            '#',
-            '',
-            'AFlagsDebug=-d_DEBUG',
-            'AFlagsInternal=-d_DEBUG',
-            'AFlagsRelease=-dNDEBUG',
-            '',
-            '#',
-            '# Set the WASM flags for each operating system',
-            '#',
-            '',
-            'AFlagscom=-d__COM__=1',
-            'AFlagsdosx32=-d__X32__=1',
-            'AFlagsdos4gw=-d__DOS4G__=1',
-            'AFlagsw32=-d__WIN32__=1',
-            '',
-            'LFlagsDebug=',
-            'LFlagsInternal=',
-            'LFlagsRelease=',
-            '',
-            'LFlagscom=format dos com libp $(%BURGER_SDKS)/dos/burgerlib',
-            'LFlagsx32=system x32r libp $(%BURGER_SDKS)/dos/burgerlib;'
-            '$(%BURGER_SDKS)/dos/x32',
-            'LFlagsdos4gw=system dos4g libp $(%BURGER_SDKS)/dos/burgerlib;'
-            '$(%BURGER_SDKS)/dos/sosaudio',
-            'LFlagsw32=system nt libp $(%BURGER_SDKS)/windows/burgerlib;'
-            '$(%BURGER_SDKS)/windows/directx9 LIBRARY VERSION.lib,opengl32.lib,'
-            'winmm.lib,shell32.lib,shfolder.lib',
-            '',
-            '# Now, set the compiler flags',
-            '',
-            'CL=WCC386 -6r -fp6 -w4 -ei -j -mf -zq -zp=8 '
-            '-wcd=7 -i=$(INCLUDE_DIRS)',
-            'CP=WPP386 -6r -fp6 -w4 -ei -j -mf -zq -zp=8 '
-            '-wcd=7 -i=$(INCLUDE_DIRS)',
-            'ASM=WASM -5r -fp6 -w4 -zq -d__WATCOM__=1',
-            'LINK=*WLINK option caseexact option quiet PATH $(%WATCOM)/binnt;'
-            '$(%WATCOM)/binw;.',
-            '',
-            '# Set the default build rules',
-            '# Requires ASM, CP to be set',
-            '',
-            '# Macro expansion is on page 93 of the C//C++ Tools User\'s Guide',
-            '# $^* = C:\\dir\\target (No extension)',
-            '# $[* = C:\\dir\\dep (No extension)',
-            '# $^@ = C:\\dir\\target.ext',
-            '# $^: = C:\\dir\\',
-            '',
-            '.i86.obj : .AUTODEPEND',
-            '\t@echo $[&.i86 / $(%CONFIG) / $(%TARGET)',
-            '\t@$(ASM) -0 -w4 -zq -d__WATCOM__=1 $(AFlags$(%CONFIG)) '
-            '$(AFlags$(%TARGET)) $[*.i86 -fo=$^@ -fr=$^*.err',
-            '',
-            '.x86.obj : .AUTODEPEND',
-            '\t@echo $[&.x86 / $(%CONFIG) / $(%TARGET)',
-            '\t@$(ASM) $(AFlags$(%CONFIG)) $(AFlags$(%TARGET)) '
-            '$[*.x86 -fo=$^@ -fr=$^*.err',
-            '',
-            '.c.obj : .AUTODEPEND',
-            '\t@echo $[&.c / $(%CONFIG) / $(%TARGET)',
-            '\t@$(CP) $(CFlags$(%CONFIG)) $(CFlags$(%TARGET)) $[*.c '
-            '-fo=$^@ -fr=$^*.err',
-            '',
-            '.cpp.obj : .AUTODEPEND',
-            '\t@echo $[&.cpp / $(%CONFIG) / $(%TARGET)',
-            '\t@$(CP) $(CFlags$(%CONFIG)) $(CFlags$(%TARGET)) $[*.cpp '
-            '-fo=$^@ -fr=$^*.err'
-        ])
+        line_list.extend(_WMK_RULES)
         return 0
 
     def write_files(self, line_list):
@@ -455,41 +510,27 @@ class Project(object):
             ''
         ])
 
-        obj_list = []
+        # Strip the directory and the extension
+        obj_list = None
         if self.solution.project_list:
-            codefiles = self.solution.project_list[0].codefiles
-        else:
-            codefiles = []
-
-        for item in codefiles:
-            if item.type is FileTypes.c or \
-                    item.type is FileTypes.cpp or \
-                    item.type is FileTypes.x86:
-
-                tempfile = convert_to_linux_slashes(
-                    item.relative_pathname)
-                index = tempfile.rfind('.')
-                if index == -1:
-                    entry = tempfile
-                else:
-                    entry = tempfile[:index]
-
-                index = entry.rfind('/')
-                if index != -1:
-                    entry = entry[index + 1:]
-
-                obj_list.append(entry)
-
-        if obj_list:
-            colon = 'OBJS= '
-            for item in sorted(obj_list):
-                line_list.append(colon + '$(A)/' + item + '.obj &')
-                colon = '\t'
-            # Remove the ' &' from the last line
-            line_list[-1] = line_list[-1][:-2]
-
-        else:
+            obj_list = [
+                os.path.splitext(os.path.basename(
+                    convert_to_linux_slashes(item.relative_pathname)))[0]
+                for item in self.solution.project_list[0].codefiles
+                if item.type in _WMK_OBJECT_TYPES]
+
+        # Nothing to compile?
+        if not obj_list:
             line_list.append('OBJS=')
+            return 0
+
+        # One object file per line, every line but the last
+        # ends with a line continuation
+        obj_list.sort()
+        lines = ['\t$(A)/' + item + '.obj &' for item in obj_list]
+        lines[0] = 'OBJS= ' + lines[0][1:]
+        lines[-1] = lines[-1][:-2]
+        line_list.extend(lines)
         return 0
 
     def write_all_target(self, line_list):
@@ -505,11 +546,9 @@ class Project(object):
             ''
         ])
 
-        target_list = ['all:']
-        for item in self.configuration_names:
-            target_list.append(item.name)
-        target_list.append('.SYMBOLIC')
-        line_list.append(' '.join(target_list))
+        line_list.append(' '.join(
+            ['all:'] + [item.name for item in self.configuration_names] +
+            ['.SYMBOLIC']))
         line_list.append('\t@%null')
 
         line_list.extend([
@@ -520,52 +559,43 @@ class Project(object):
         ])
 
         # Build targets for configuations
+        platform_codes = [self.platform_codes[platform]
+                          for platform in self.platforms]
         for configuration in self.configuration_names:
-            line_list.append('')
-            target_list = [configuration.name + ':']
-            for platform in self.platforms:
-                target_list.append(
-                    configuration.name +
-                    platform.get_short_code())
-            target_list.append('.SYMBOLIC')
-            line_list.append(' '.join(target_list))
-            line_list.append('\t@%null')
+            line_list.extend([
+                '',
+                ' '.join(
+                    [configuration.name + ':'] +
+                    [configuration.name + code for code in platform_codes] +
+                    ['.SYMBOLIC']),
+                '\t@%null'])
 
         # Build targets for platforms
         for platform in self.platforms:
-            line_list.append('')
-            target_list = [platform.get_short_code() + ':']
-            for configuration in self.configuration_list:
-                target_list.append(
-                    configuration.name +
-                    platform.get_short_code())
-            target_list.append('.SYMBOLIC')
-            line_list.append(' '.join(target_list))
-            line_list.append('\t@%null')
+            code = self.platform_codes[platform]
+            line_list.extend([
+                '',
+                ' '.join(
+                    [code + ':'] +
+                    [name + code
+                     for name in self.platform_configurations[platform]] +
+                    ['.SYMBOLIC']),
+                '\t@%null'])
 
         for configuration in self.configuration_list:
-            if configuration.project_type is ProjectTypes.library:
-                suffix = 'lib'
-            else:
-                suffix = 'exe'
-            platform = configuration.platform
-            line_list.append('')
-            line_list.append(
-                '{0}{1}: .SYMBOLIC'.format(
-                    configuration.name,
-                    platform.get_short_code()))
-            line_list.append('\t@if not exist "$(DESTINATION_DIR)" '
-                             '@mkdir "$(DESTINATION_DIR)"')
-            name = 'wat' + platform.get_short_code(
-            )[-3:] + configuration.short_code
-            line_list.append('\t@if not exist "$(BASE_TEMP_DIR){0}" '
-                             '@mkdir "$(BASE_TEMP_DIR){0}"'.format(name))
-            line_list.append('\t@set CONFIG=' + configuration.name)
-            line_list.append('\t@set TARGET=' + platform.get_short_code())
-            line_list.append(
-                '\t@%make $(DESTINATION_DIR)\\$(PROJECT_NAME)wat' +
-                platform.get_short_code()[-3:] +
-                configuration.short_code + '.' + suffix)
+            platform_code = self.platform_codes[configuration.platform]
+            line_list.extend([
+                '',
+                '{0}{1}: .SYMBOLIC'.format(configuration.name, platform_code),
+                '\t@if not exist "$(DESTINATION_DIR)" '
+                '@mkdir "$(DESTINATION_DIR)"',
+                '\t@if not exist "$(BASE_TEMP_DIR){0}" '
+                '@mkdir "$(BASE_TEMP_DIR){0}"'.format(
+                    configuration.watcom_name),
+                '\t@set CONFIG=' + configuration.name,
+                '\t@set TARGET=' + platform_code,
+                '\t@%make $(DESTINATION_DIR)\\$(PROJECT_NAME)' +
+                configuration.watcom_binary])
 
         line_list.extend([
             '',
@@ -592,28 +622,16 @@ class Project(object):
 
 
         for configuration in self.configuration_list:
-            if configuration.project_type is ProjectTypes.library:
-                suffix = '.lib'
-            else:
-                suffix = '.exe'
-            line_list.append('')
-            line_list.append(
-                'A = $(BASE_TEMP_DIR)wat' +
-                configuration.platform.get_short_code()[-3:] +
-                configuration.short_code)
-
-            line_list.append(
-                '$(DESTINATION_DIR)\\$(PROJECT_NAME)wat' +
-                configuration.platform.get_short_code()[-3:] +
-                configuration.short_code + suffix +
-                ': $+$(OBJS)$- ' + self.solution.watcom_filename)
+            line_list.extend([
+                '',
+                'A = $(BASE_TEMP_DIR)' + configuration.watcom_name,
+                '$(DESTINATION_DIR)\\$(PROJECT_NAME)' +
+                configuration.watcom_binary +
+                ': $+$(OBJS)$- ' + self.solution.watcom_filename])
 
             if configuration.project_type is ProjectTypes.library:
 
-                line_list.extend([
-                    '\t@SET WOW=$+$(OBJS)$-',
-                    '\t@WLIB -q -b -c -n $^@ @WOW'
-                ])
+                line_list.extend(_WMK_LIBRARY_BUILD)
 
                 if configuration.deploy_folder:
                     deploy_folder = convert_to_windows_slashes(
@@ -625,11 +643,7 @@ class Project(object):
                         '\t@p4 revert -a "{}\\$^."'.format(deploy_folder)
                     ])
             else:
-                line_list.extend([
-                    '\t@SET WOW={$+$(OBJS)$-}',
-                    '\t@$(LINK) $(LFlags$(%TARGET)) $(LFlags$(%CONFIG)) '
-                    'LIBRARY burger$(BASE_SUFFIX).lib NAME $^@ FILE @wow'
-                ])
+                line_list.extend(_WMK_EXE_BUILD)
 
         return 0
 
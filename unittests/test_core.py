@@ -0,0 +1,111 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+""" Unit tests for makeprojects.core
+
+Copyright 2013-2019 by Rebecca Ann Heineman becky@burgerbecky.com
+
+It is released under an MIT Open Source license. Please see LICENSE
+for license details. Yes, you can use it in a
+commercial title without paying anything, just give me a credit.
+Please? It's not like I'm asking you for money!
+
+"""
+
+import os
+from makeprojects.core import SourceFile, Project, source_file_buckets
+from makeprojects.enums import FileTypes
+
+########################################
+
+
+def test_sourcefile_get_group_name():
+    """
+    Test SourceFile.get_group_name().
+    """
+
+    tests = (
+        ('foo.cpp', ''),
+        ('source/foo.cpp', 'source'),
+        ('source\\windows\\foo.cpp', 'source\\windows'),
+        ('..\\source\\foo.cpp', 'source'),
+        ('..\\..\\source\\foo.cpp', 'source'),
+        ('.\\source\\foo.cpp', 'source'),
+        ('..\\.\\source\\foo.cpp', 'source'),
+        ('..\\foo.cpp', '..'),
+        ('.\\foo.cpp', '.')
+    )
+
+    for test in tests:
+        source_file = SourceFile(test[0], '', FileTypes.cpp)
+        assert source_file.get_group_name() == test[1]
+
+########################################
+
+
+def test_sourcefile_slots():
+    """
+    Test SourceFile only uses slots for storage.
+    """
+
+    source_file = SourceFile('source/foo.cpp', '', FileTypes.cpp)
+    assert not hasattr(source_file, '__dict__')
+
+    # Attribute used by the Visual Studio 2003-2008 exporter
+    source_file.vs_name = source_file.relative_pathname
+    assert source_file.vs_name == 'source\\foo.cpp'
+
+########################################
+
+
+def test_project_get_file_list(tmpdir):
+    """
+    Test Project.get_file_list() scanning several source folders.
+    """
+
+    # Create a small source tree
+    tmpdir.join('a.cpp').write('')
+    tmpdir.join('b.h').write('')
+    tmpdir.join('x.png').write('')
+    source_dir = tmpdir.mkdir('source')
+    source_dir.join('c.cpp').write('')
+    source_dir.mkdir('sub').join('d.c').write('')
+    tmpdir.mkdir('src').join('e.cpp').write('')
+
+    project = Project('test')
+    project.working_directory = str(tmpdir)
+    project.source_folders_list = ['.', 'source/*.*', 'src']
+    project.get_file_list([FileTypes.cpp, FileTypes.h, FileTypes.c])
+
+    assert [item.relative_pathname for item in project.codefiles] == [
+        'a.cpp', 'b.h', 'source\\c.cpp', 'source\\sub\\d.c', 'src\\e.cpp']
+    assert project._source_include_list == sorted(
+        ['.', 'source', os.path.join('source', 'sub'), 'src'])
+
+    # Single folder, without recursion, filtering on type
+    project.source_folders_list = ['source']
+    project.get_file_list([FileTypes.cpp])
+    assert [item.relative_pathname for item in project.codefiles] == [
+        'source\\c.cpp']
+
+########################################
+
+
+def test_source_file_buckets():
+    """
+    Test source_file_buckets() splitting by type in order.
+    """
+
+    file_list = [
+        SourceFile('a.h', '', FileTypes.h),
+        SourceFile('b.cpp', '', FileTypes.cpp),
+        SourceFile('c.png', '', FileTypes.image),
+        SourceFile('d.h', '', FileTypes.h)]
+
+    buckets = source_file_buckets(
+        file_list, (FileTypes.h, FileTypes.cpp, FileTypes.rc))
+    assert sorted(buckets) == sorted(
+        [FileTypes.h, FileTypes.cpp, FileTypes.rc])
+    assert buckets[FileTypes.h] == [file_list[0], file_list[3]]
+    assert buckets[FileTypes.cpp] == [file_list[1]]
+    assert buckets[FileTypes.rc] == []
@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+""" Unit tests for makeprojects.defaults
+
+Copyright 2013-2019 by Rebecca Ann Heineman becky@burgerbecky.com
+
+It is released under an MIT Open Source license. Please see LICENSE
+for license details. Yes, you can use it in a
+commercial title without paying anything, just give me a credit.
+Please? It's not like I'm asking you for money!
+
+"""
+
+import argparse
+from makeprojects.enums import IDETypes, PlatformTypes
+from makeprojects.defaults import fixup_ide_platform, get_ide_list, \
+    get_platform_list, get_project_name
+
+########################################
+
+
+def test_fixup_ide_platform():
+    """
+    Test fixup_ide_platform() choosing an IDE for a platform.
+    """
+
+    tests = (
+        ([PlatformTypes.xbox], IDETypes.vs2003),
+        ([PlatformTypes.xbox360], IDETypes.vs2010),
+        ([PlatformTypes.ps4], IDETypes.vs2015),
+        ([PlatformTypes.switch], IDETypes.vs2017),
+        # Priority is by platform, not by the order in the list
+        ([PlatformTypes.switch, PlatformTypes.xbox360], IDETypes.vs2010)
+    )
+
+    for test in tests:
+        ide_list = []
+        platform_list = list(test[0])
+        fixup_ide_platform(ide_list, platform_list)
+        assert ide_list == [test[1]]
+        assert platform_list == test[0]
+
+    # Unknown platforms use the default IDE
+    ide_list = []
+    fixup_ide_platform(ide_list, [PlatformTypes.linux])
+    assert ide_list == [IDETypes.default()]
+
+    # An IDE without a platform uses the host platform
+    platform_list = []
+    fixup_ide_platform([IDETypes.vs2017], platform_list)
+    assert platform_list == [PlatformTypes.default()]
+
+########################################
+
+
+def test_get_ide_platform_list():
+    """
+    Test get_ide_list() and get_platform_list() removing duplicates.
+    """
+
+    args = argparse.Namespace(
+        ides=['vs2017', 'xcode3', 'VS2017', IDETypes.vs2017],
+        platforms=['linux', 'win32', 'Linux'],
+        verbose=False)
+
+    assert get_ide_list([], '.', args) == [IDETypes.vs2017, IDETypes.xcode3]
+    assert get_platform_list([], '.', args) == [
+        PlatformTypes.linux, PlatformTypes.win32]
+
+########################################
+
+
+def test_get_project_name():
+    """
+    Test get_project_name() using the first name from build_rules.py.
+    """
+
+    def no_name(command, **kargs):
+        """ build_rules.py without a project name """
+        del command, kargs
+        return 0
+
+    def name_foo(command, **kargs):
+        """ build_rules.py that names the project foo """
+        del kargs
+        return 'foo' if command == 'default_project_name' else 0
+
+    def name_bar(command, **kargs):
+        """ build_rules.py that names the project bar """
+        del kargs
+        return 'bar' if command == 'default_project_name' else 0
+
+    args = argparse.Namespace(name=None, verbose=False)
+    assert get_project_name(
+        [no_name, name_foo, name_bar], '/temp/proj', args) == 'foo'
+    assert get_project_name([no_name], '/temp/proj', args) == 'proj'
+
+    # The command line wins
+    args.name = 'cmd'
+    assert get_project_name([name_foo], '/temp/proj', args) == 'cmd'
@@ -27,6 +27,10 @@ def test_filetypes_lookup():
         ('foo', None),
         ('foo.txt', FileTypes.generic),
         ('.txt', None),
+        ('..txt', None),
+        ('foo.', None),
+        ('FOO.CPP', FileTypes.cpp),
+        ('foo.bar.h', FileTypes.h),
         ('shader.hlsl', FileTypes.hlsl),
         ('fun.ico', FileTypes.ico),
         ('burger.lib', FileTypes.library),
@@ -67,7 +71,10 @@ def test_projecttypes_lookup():
         ('tool', ProjectTypes.tool),
         ('console', ProjectTypes.tool),
         ('library', ProjectTypes.library),
-        ('lib', ProjectTypes.library)
+        ('lib', ProjectTypes.library),
+        ('APP', ProjectTypes.app),
+        ('Dynamic Library', ProjectTypes.sharedlibrary),
+        ('foo', None)
     )
 
     for test in tests:
@@ -12,8 +12,11 @@ Please? It's not like I'm asking you for money!
 
 """
 
-from makeprojects.visual_studio import get_uuid, VS2003XML
+from makeprojects.visual_studio import get_uuid, VS2003XML, build_file_tree, \
+    create_copy_file_script
 from makeprojects.validators import StringProperty
+from makeprojects.core import SourceFile
+from makeprojects.enums import FileTypes
 
 ########################################
 
@@ -117,3 +120,41 @@ def test_vs2003xml():
         '\t<Platform\n'
         '\t\tName="Win32"\n\t/>\n'
         '</VisualStudioProject>')
+
+########################################
+
+
+def test_build_file_tree():
+    """
+    Test makeprojects.visual_studio.build_file_tree
+    """
+
+    codefiles = [
+        SourceFile('source/a.cpp', '', FileTypes.cpp),
+        SourceFile('source/windows/b.cpp', '', FileTypes.cpp),
+        SourceFile('source/c.h', '', FileTypes.h),
+        SourceFile('main.cpp', '', FileTypes.cpp)]
+
+    groups, tree = build_file_tree(codefiles)
+    assert groups == {
+        '': [codefiles[3]],
+        'source': [codefiles[0], codefiles[2]],
+        'source\\windows': [codefiles[1]]}
+    assert tree == {'': {}, 'source': {'windows': {}}}
+    assert codefiles[1].vs_name == 'source\\windows\\b.cpp'
+
+########################################
+
+
+def test_create_copy_file_script():
+    """
+    Test makeprojects.visual_studio.create_copy_file_script
+    """
+
+    assert create_copy_file_script('$(TargetPath)', 'bin\\a.exe', False) == [
+        'copy /Y "$(TargetPath)" "bin\\a.exe"']
+
+    assert create_copy_file_script('$(TargetPath)', 'bin\\a.exe', True) == [
+        'cmd /c p4 edit "bin\\a.exe"',
+        'copy /Y "$(TargetPath)" "bin\\a.exe"',
+        'cmd /c p4 revert -a "bin\\a.exe"']